@@ -1,9 +1,12 @@
+import asyncio
+import itertools
 import threading
 import time
 from typing import Optional
 
 import json
 import os
+import re
 import subprocess
 from pathlib import Path
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
@@ -12,85 +15,151 @@ from fastapi.responses import HTMLResponse, StreamingResponse, JSONResponse
 
 from ndi import NDIReceiver, NDISourceFinder
 import logging
+import queue
 from collections import deque
-from threading import RLock
-from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
 app = FastAPI()
 
+
+# WebSocket payloads are serialized straight to UTF-8 bytes
+if ORJSON_AVAILABLE:
+    def _json_bytes(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    _json_loads = orjson.loads
+else:
+    def _json_bytes(obj) -> bytes:
+        return json.dumps(obj).encode("utf-8")
+
+    _json_loads = json.loads
+
+
+# Broadcast backpressure: at most this many sends in flight, and a client
+# that can't take a message within the timeout is dropped as dead
+WS_SEND_CONCURRENCY = 64
+WS_SEND_TIMEOUT = 2.0
+
+
 # WebSocket connection manager for real-time config updates
 class ConnectionManager:
     def __init__(self):
-        self.active_connections: list[WebSocket] = []
-        self._lock = threading.Lock()
+        self.active_connections: set[WebSocket] = set()
+        # Only touched from the event loop, so an asyncio lock suffices
+        self._lock = asyncio.Lock()
+        self._send_sem = asyncio.Semaphore(WS_SEND_CONCURRENCY)
+        self._last_config_message: Optional[bytes] = None
 
     async def connect(self, websocket: WebSocket):
         await websocket.accept()
-        with self._lock:
-            self.active_connections.append(websocket)
+        async with self._lock:
+            self.active_connections.add(websocket)
 
-    def disconnect(self, websocket: WebSocket):
-        with self._lock:
-            if websocket in self.active_connections:
-                self.active_connections.remove(websocket)
+    async def disconnect(self, websocket: WebSocket):
+        async with self._lock:
+            self.active_connections.discard(websocket)
 
     async def broadcast_config(self):
-        """Broadcast current config to all connected clients."""
+        """Broadcast current config to all connected clients.
+        Skipped when identical to the last broadcast; new clients are sent
+        the config directly on connect.
+        """
         config = _get_config_dict()
-        message = json.dumps({"type": "config", "data": config})
+        message = _json_bytes({"type": "config", "data": config})
+        if message == self._last_config_message:
+            return
+        self._last_config_message = message
         await self._broadcast_message(message)
 
     async def broadcast_logs(self, logs: list):
-        """Broadcast logs to all connected clients."""
-        message = json.dumps({"type": "logs", "data": logs})
+        """Broadcast a batch of new log records to all connected clients."""
+        message = _json_bytes({"type": "logs_batch", "data": logs})
         await self._broadcast_message(message)
 
-    async def _broadcast_message(self, message: str):
-        """Send a message to all connected clients."""
-        with self._lock:
-            connections = list(self.active_connections)
-        
-        dead = []
-        for conn in connections:
-            try:
-                await conn.send_text(message)
-            except Exception:
-                dead.append(conn)
-        
+    async def _send(self, conn: WebSocket, data: bytes):
+        async with self._send_sem:
+            await asyncio.wait_for(conn.send_bytes(data), WS_SEND_TIMEOUT)
+
+    async def _close(self, conn: WebSocket):
+        """Close a dropped client so its page sees onclose and reconnects."""
+        try:
+            await asyncio.wait_for(conn.close(code=1011), WS_SEND_TIMEOUT)
+        except Exception:
+            pass
+
+    async def _broadcast_message(self, data: bytes):
+        """Send a message to all connected clients.
+        Sent as a binary frame so clients share one encoded buffer;
+        the page decodes binary frames back to text.
+        """
+        # No await between here and the copy, so no lock is needed
+        connections = list(self.active_connections)
+
+        # Send concurrently so one slow client doesn't stall the others
+        results = await asyncio.gather(
+            *(self._send(conn, data) for conn in connections),
+            return_exceptions=True,
+        )
+        dead = [conn for conn, r in zip(connections, results) if isinstance(r, Exception)]
+
         if dead:
-            with self._lock:
-                for conn in dead:
-                    if conn in self.active_connections:
-                        self.active_connections.remove(conn)
+            async with self._lock:
+                self.active_connections.difference_update(dead)
+            await asyncio.gather(*(self._close(conn) for conn in dead))
 
 ws_manager = ConnectionManager()
 
 # Background task to handle broadcasts from sync context
-import asyncio
 _broadcast_queue: asyncio.Queue = None
+_broadcast_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Minimum spacing between log broadcasts; records arriving in between
+# are sent together in the next batch
+LOG_BROADCAST_INTERVAL = 0.1
 
 async def _broadcast_worker():
     """Background worker that processes broadcast requests."""
-    global _broadcast_queue, _log_broadcast_queue
+    global _broadcast_queue, _log_broadcast_queue, _broadcast_loop
+    _broadcast_loop = asyncio.get_running_loop()
     _broadcast_queue = asyncio.Queue()
     _log_broadcast_queue = asyncio.Queue()
     
+    def _drain(q: asyncio.Queue):
+        # Coalesce bursts: any signals queued while we were busy are
+        # satisfied by the single broadcast that follows.
+        while not q.empty():
+            q.get_nowait()
+
     async def config_worker():
         while True:
             await _broadcast_queue.get()
+            _drain(_broadcast_queue)
             try:
                 await ws_manager.broadcast_config()
             except Exception as e:
                 logging.getLogger("app").warning(f"Config broadcast failed: {e}")
     
     async def logs_worker():
+        last_sent_id = 0
         while True:
             await _log_broadcast_queue.get()
+            _drain(_log_broadcast_queue)
             try:
-                logs = ring_handler.snapshot()
+                logs = ring_handler.snapshot(since_id=last_sent_id)
+                if not logs:
+                    continue
+                # Records are appended in id order by the single listener thread
+                last_sent_id = logs[-1]["id"]
                 await ws_manager.broadcast_logs(logs)
             except Exception as e:
                 pass  # Don't log broadcast failures (would cause infinite loop)
+            await asyncio.sleep(LOG_BROADCAST_INTERVAL)
     
     await asyncio.gather(config_worker(), logs_worker())
 
@@ -98,6 +167,12 @@ async def _broadcast_worker():
 async def startup_event():
     asyncio.create_task(_broadcast_worker())
 
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    _flush_config()
+    log_listener.stop()
+
 # Serve static assets (e.g., splash image)
 app.mount("/static", StaticFiles(directory="static"), name="static")
 
@@ -123,13 +198,23 @@ hdmi_blank: bool = False
 # In-memory log buffer (current session)
 _log_broadcast_queue: asyncio.Queue = None
 
+class _DeferredQueueHandler(QueueHandler):
+    """QueueHandler that enqueues records untouched.
+    The stock prepare() formats on the caller's thread; leave that to the listener.
+    """
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
 class _RingLogHandler(logging.Handler):
     def __init__(self, capacity: int = 200):
         super().__init__()
         self.capacity = capacity
         self.buffer = deque(maxlen=capacity)
-        self._id = 0
-        self._lock = RLock()
+        self._ids = itertools.count(1)
+        # Timestamp string cache; records within the same second share it
+        self._ts_sec = -1
+        self._ts_str = ""
 
     def emit(self, record: logging.LogRecord):
         try:
@@ -139,33 +224,46 @@ class _RingLogHandler(logging.Handler):
         # Skip noisy entries
         if not _should_log(record, msg):
             return
-        with self._lock:
-            self._id += 1
-            self.buffer.append({
-                "id": self._id,
-                "ts": datetime.utcnow().isoformat(timespec="seconds") + "Z",
-                "level": record.levelname,
-                "logger": record.name,
-                "msg": msg,
-            })
+        sec = int(record.created)
+        if sec != self._ts_sec:
+            self._ts_sec = sec
+            self._ts_str = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(sec))
+        self.buffer.append({
+            "id": next(self._ids),
+            "ts": self._ts_str,
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": msg,
+        })
         # Trigger log broadcast
         _broadcast_logs()
 
-    def snapshot(self):
-        with self._lock:
-            return list(self.buffer)
+    def snapshot(self, since_id: int = 0):
+        # list(deque) copies in one C call, so it never sees a half-done
+        # append; a record landing concurrently is simply in or out
+        items = list(self.buffer)
+        if since_id <= 0:
+            return items
+        return [r for r in items if r["id"] > since_id]
 
 
 ring_handler = _RingLogHandler(200)
 ring_handler.setFormatter(logging.Formatter("%(message)s"))
 
+# Logging calls only enqueue; formatting, buffering and the broadcast
+# trigger happen on the listener thread
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+queue_handler = _DeferredQueueHandler(_log_queue)
+log_listener = QueueListener(_log_queue, ring_handler)
+log_listener.start()
+
 root_logger = logging.getLogger()
 root_logger.setLevel(logging.INFO)
-root_logger.addHandler(ring_handler)
+root_logger.addHandler(queue_handler)
 
 # Attach to uvicorn loggers as well
 for name in ("uvicorn", "uvicorn.error", "uvicorn.access"):
-    logging.getLogger(name).addHandler(ring_handler)
+    logging.getLogger(name).addHandler(queue_handler)
 
 # Filter noisy access logs in the ring buffer
 FILTER_SUBSTRINGS = [
@@ -183,48 +281,134 @@ def _should_log(record: logging.LogRecord, formatted: str) -> bool:
 # Persistent config shared with display.py
 CONFIG_FILE = Path.home() / ".ndi-monitor-config.json"
 
-def _save_config_fields(update: dict):
-    """Atomically update the shared config file with provided fields.
-    Preserves existing keys and ensures durability across reboots.
+# Parsed config kept in memory; the file is only re-parsed when its
+# mtime changes (e.g. edited by hand), so reads cost one stat()
+_config_cache: Optional[dict] = None
+_config_mtime_ns: Optional[int] = None
+_config_cache_lock = threading.Lock()
+
+# Writes are batched: changes land in the cache immediately and are flushed
+# to disk CONFIG_SAVE_DELAY seconds later (so a slider drag costs one fsync).
+# Fields display.py must act on promptly are flushed straight away.
+CONFIG_SAVE_DELAY = 0.25
+CONFIG_IMMEDIATE_FIELDS = frozenset({"selected_source", "hdmi_blank"})
+_config_dirty = False
+_config_flush_timer: Optional[threading.Timer] = None
+# Consecutive failed writes; retries back off up to CONFIG_RETRY_MAX_DELAY
+_config_flush_failures = 0
+CONFIG_RETRY_MAX_DELAY = 60.0
+_config_write_lock = threading.Lock()
+
+
+def _read_config_from_disk() -> dict:
+    """Read and parse the shared config file."""
+    try:
+        return _json_loads(CONFIG_FILE.read_bytes()) or {}
+    except FileNotFoundError:
+        pass
+    except Exception as e:
+        logging.getLogger("app").warning(f"Failed to load config: {e}")
+    return {}
+
+
+def _refresh_config_cache():
+    """Re-parse the config file if it changed on disk.
+    Caller must hold _config_cache_lock.
     """
+    global _config_cache, _config_mtime_ns
+    if _config_cache is not None and _config_dirty:
+        return  # Unsaved local changes take precedence
+    try:
+        mtime = os.stat(CONFIG_FILE).st_mtime_ns
+    except OSError:
+        mtime = None
+    if _config_cache is None or mtime != _config_mtime_ns:
+        _config_cache = _read_config_from_disk()
+        _config_mtime_ns = mtime
+
+
+def _write_config_file(config: dict):
+    """Atomically replace the shared config file, durable across reboots."""
+    tmp = CONFIG_FILE.with_suffix(".tmp")
     try:
-        current = {}
-        if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                try:
-                    current = json.load(f) or {}
-                except Exception:
-                    current = {}
-
-        current.update(update or {})
-        tmp = CONFIG_FILE.with_suffix(".tmp")
         with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(current, f, ensure_ascii=False)
+            json.dump(config, f, ensure_ascii=False)
             f.flush()
             os.fsync(f.fileno())
 
-        # Atomic replace
+        # Atomic replace; tmp no longer exists afterwards
+        os.replace(tmp, CONFIG_FILE)
+    except Exception:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _flush_config():
+    """Write pending config changes to disk, if any."""
+    global _config_dirty, _config_flush_timer, _config_mtime_ns, _config_flush_failures
+    with _config_write_lock:
+        with _config_cache_lock:
+            _config_flush_timer = None
+            if not _config_dirty:
+                return
+            snapshot = dict(_config_cache)
+            _config_dirty = False
         try:
-            os.replace(tmp, CONFIG_FILE)
-        finally:
-            if tmp.exists():
-                try:
-                    tmp.unlink()
-                except Exception:
-                    pass
-    except Exception as e:
-        logging.getLogger("app").warning(f"Failed to save config: {e}")
+            _write_config_file(snapshot)
+            # Remember our own write so it isn't re-parsed on the next read
+            mtime = os.stat(CONFIG_FILE).st_mtime_ns
+            with _config_cache_lock:
+                _config_mtime_ns = mtime
+            if _config_flush_failures:
+                logging.getLogger("app").info(f"Config saved after {_config_flush_failures} failed attempts")
+                _config_flush_failures = 0
+        except Exception as e:
+            _config_flush_failures += 1
+            with _config_cache_lock:
+                _config_dirty = True
+                # Retry later so the change isn't lost without another save,
+                # backing off while the write keeps failing (read-only or full disk)
+                if _config_flush_timer is None:
+                    delay = min(CONFIG_SAVE_DELAY * 2 ** _config_flush_failures, CONFIG_RETRY_MAX_DELAY)
+                    _config_flush_timer = threading.Timer(delay, _flush_config)
+                    _config_flush_timer.daemon = True
+                    _config_flush_timer.start()
+            # Log only the first failure of a streak; each record reaches every client
+            if _config_flush_failures == 1:
+                logging.getLogger("app").warning(f"Failed to save config: {e}")
+
+
+def _save_config_fields(update: dict):
+    """Update the shared config with provided fields.
+    Preserves existing keys; the write to disk is batched unless a
+    field in CONFIG_IMMEDIATE_FIELDS changed.
+    """
+    global _config_dirty, _config_flush_timer
+    update = update or {}
+    with _config_cache_lock:
+        _refresh_config_cache()
+        _config_cache.update(update)
+        _config_dirty = True
+
+        immediate = not CONFIG_IMMEDIATE_FIELDS.isdisjoint(update)
+        if immediate:
+            if _config_flush_timer is not None:
+                _config_flush_timer.cancel()
+                _config_flush_timer = None
+        elif _config_flush_timer is None:
+            _config_flush_timer = threading.Timer(CONFIG_SAVE_DELAY, _flush_config)
+            _config_flush_timer.daemon = True
+            _config_flush_timer.start()
+
+    if immediate:
+        _flush_config()
 
 
 def _load_config_file() -> dict:
-    """Load the shared config file."""
-    try:
-        if CONFIG_FILE.exists():
-            with open(CONFIG_FILE, "r", encoding="utf-8") as f:
-                return json.load(f) or {}
-    except Exception as e:
-        logging.getLogger("app").warning(f"Failed to load config: {e}")
-    return {}
+    """Load the shared config (served from memory while the file is unchanged)."""
+    with _config_cache_lock:
+        _refresh_config_cache()
+        return dict(_config_cache)
 
 
 def _get_config_dict() -> dict:
@@ -241,21 +425,25 @@ def _get_config_dict() -> dict:
 
 
 def _broadcast_config_update():
-    """Broadcast config update to all WebSocket clients."""
+    """Broadcast config update to all WebSocket clients.
+    Called from sync endpoints on the threadpool, so hand off to the event loop.
+    """
     global _broadcast_queue
-    if _broadcast_queue is not None:
+    if _broadcast_queue is not None and _broadcast_loop is not None:
         try:
-            _broadcast_queue.put_nowait(True)
+            _broadcast_loop.call_soon_threadsafe(_broadcast_queue.put_nowait, True)
         except Exception:
             pass
 
 
 def _broadcast_logs():
-    """Broadcast logs to all WebSocket clients."""
+    """Broadcast logs to all WebSocket clients.
+    Called from the log listener thread, so hand off to the event loop.
+    """
     global _log_broadcast_queue
-    if _log_broadcast_queue is not None:
+    if _log_broadcast_queue is not None and _broadcast_loop is not None:
         try:
-            _log_broadcast_queue.put_nowait(True)
+            _broadcast_loop.call_soon_threadsafe(_log_broadcast_queue.put_nowait, True)
         except Exception:
             pass
 
@@ -265,19 +453,21 @@ async def websocket_endpoint(websocket: WebSocket):
     await ws_manager.connect(websocket)
     # Send initial config and logs on connect
     config = _get_config_dict()
-    await websocket.send_text(json.dumps({"type": "config", "data": config}))
+    await websocket.send_bytes(_json_bytes({"type": "config", "data": config}))
     logs = ring_handler.snapshot()
-    await websocket.send_text(json.dumps({"type": "logs", "data": logs}))
+    await websocket.send_bytes(_json_bytes({"type": "logs", "data": logs}))
     try:
         while True:
             # Keep connection alive, handle any incoming messages
             data = await websocket.receive_text()
-            # Client can request config refresh
+            # Client can request a full resync of config and logs
             if data == "refresh":
                 config = _get_config_dict()
-                await websocket.send_text(json.dumps({"type": "config", "data": config}))
+                await websocket.send_bytes(_json_bytes({"type": "config", "data": config}))
+                logs = ring_handler.snapshot()
+                await websocket.send_bytes(_json_bytes({"type": "logs", "data": logs}))
     except WebSocketDisconnect:
-        ws_manager.disconnect(websocket)
+        await ws_manager.disconnect(websocket)
 
 
 @app.get("/api/config")
@@ -293,8 +483,8 @@ def index() -> str:
 
 
 @app.get("/api/sources")
-def list_sources():
-    sources = finder.list_sources(timeout_ms=500)
+async def list_sources():
+    sources = await asyncio.to_thread(finder.list_sources, 500)
     logging.getLogger("app").debug(f"Discovered sources: {len(sources)}")
     return {"sources": sources}
 
@@ -304,30 +494,39 @@ def get_selected():
     return {"selected": selected_source_name}
 
 
+def _replace_receiver(name: str):
+    """Close the current receiver and connect a new one (blocking)."""
+    global receiver
+    with receiver_lock:
+        if receiver is not None:
+            try:
+                receiver.close()
+            except Exception:
+                pass
+            receiver = None
+
+        receiver = NDIReceiver(source_name=name)
+
+
 @app.post("/api/select")
-def select_source(payload: dict):
-    global receiver, selected_source_name
+async def select_source(payload: dict):
+    global selected_source_name
 
     name = (payload or {}).get("name")
     if not name or not isinstance(name, str):
         raise HTTPException(status_code=400, detail="Missing 'name'")
 
     # Always save to config first so display.py picks it up
-    # and so selection persists even if receiver creation fails
-    _save_config_fields({"selected_source": name})
+    # and so selection persists even if receiver creation fails.
+    # selected_source is written (and fsynced) immediately; keep that
+    # blocking write off the event loop
+    await asyncio.to_thread(_save_config_fields, {"selected_source": name})
     selected_source_name = name
     _broadcast_config_update()
 
     try:
-        with receiver_lock:
-            if receiver is not None:
-                try:
-                    receiver.close()
-                except Exception:
-                    pass
-                receiver = None
-
-            receiver = NDIReceiver(source_name=name)
+        # Source discovery can take seconds; keep it off the event loop
+        await asyncio.to_thread(_replace_receiver, name)
         logging.getLogger("app").info(f"Selected source: {name}")
         return {"ok": True, "selected": selected_source_name}
     except Exception as e:
@@ -424,10 +623,10 @@ def update_message(payload: dict):
 
 
 @app.post("/api/reboot")
-def reboot_system():
+async def reboot_system():
     try:
         # Requires passwordless sudo for /sbin/reboot
-        subprocess.Popen(["sudo", "/sbin/reboot"])  # do not wait; connection will drop
+        await asyncio.create_subprocess_exec("sudo", "/sbin/reboot")  # do not wait; connection will drop
         logging.getLogger("app").warning("Reboot requested via API")
         return {"ok": True}
     except Exception as e:
@@ -496,41 +695,63 @@ def set_device_name(payload: dict):
     return {"device_name": val}
 
 
+async def _run_command(cmd: list, timeout: float, text: bool = False, env: Optional[dict] = None) -> subprocess.CompletedProcess:
+    """Async equivalent of subprocess.run(cmd, capture_output=True, ...).
+    Raises subprocess.TimeoutExpired (after killing the process) on timeout.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+        env=env
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    if text:
+        stdout = stdout.decode(errors="replace")
+        stderr = stderr.decode(errors="replace")
+    return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
+
+
+# Current resolution line looks like: "Screen 0: ... current 1920 x 1080 ..."
+_XRANDR_CURRENT_RE = re.compile(
+    rb'^screen\b.*?current\s+(\d+)\s*x\s*(\d+)', re.IGNORECASE | re.MULTILINE
+)
+
+
 @app.get("/api/resolution")
-def get_resolution():
+async def get_resolution():
     """Get current and available display resolutions via xrandr"""
     try:
-        result = subprocess.run(
+        # Parse raw bytes; only the few matched tokens get decoded
+        result = await _run_command(
             ["xrandr"],
-            capture_output=True,
-            text=True,
             timeout=5,
             env={**os.environ, "DISPLAY": ":0"}
         )
         if result.returncode != 0:
             raise HTTPException(status_code=500, detail="xrandr failed")
         
-        lines = result.stdout.strip().split("\n")
+        out = result.stdout
         current = None
-        resolutions = []
-        
-        for line in lines:
-            # Current resolution line looks like: "Screen 0: ... current 1920 x 1080 ..."
-            if "current" in line.lower() and "screen" in line.lower():
-                import re
-                match = re.search(r'current\s+(\d+)\s*x\s*(\d+)', line, re.IGNORECASE)
-                if match:
-                    current = f"{match.group(1)}x{match.group(2)}"
-            
+        match = _XRANDR_CURRENT_RE.search(out)
+        if match:
+            current = f"{int(match.group(1))}x{int(match.group(2))}"
+
+        # dict keeps first-seen order while de-duplicating
+        resolutions = {}
+        for line in out.splitlines():
             # Resolution lines start with whitespace and contain resolution + refresh rate
-            if line.startswith("   "):
-                parts = line.split()
-                if parts and "x" in parts[0].lower():
-                    res = parts[0]
-                    if res not in resolutions:
-                        resolutions.append(res)
+            if line.startswith(b"   "):
+                parts = line.split(None, 1)
+                if parts and b"x" in parts[0].lower():
+                    resolutions[parts[0].decode("ascii", errors="replace")] = None
         
-        return {"current": current, "available": resolutions}
+        return {"current": current, "available": list(resolutions)}
     except subprocess.TimeoutExpired:
         raise HTTPException(status_code=500, detail="xrandr timed out")
     except Exception as e:
@@ -539,7 +760,7 @@ def get_resolution():
 
 
 @app.post("/api/resolution")
-def set_resolution(payload: dict):
+async def set_resolution(payload: dict):
     """Set display resolution via xrandr - requires display service restart"""
     if payload is None or "resolution" not in payload:
         raise HTTPException(status_code=400, detail="Missing 'resolution'")
@@ -557,9 +778,8 @@ def set_resolution(payload: dict):
     
     try:
         # Get xrandr output and parse available modes for the connected output
-        result = subprocess.run(
+        result = await _run_command(
             ["xrandr"],
-            capture_output=True,
             text=True,
             timeout=5,
             env={**os.environ, "DISPLAY": ":0"}
@@ -593,23 +813,21 @@ def set_resolution(payload: dict):
         largest_mode = max(available_modes, key=mode_key)
 
         # Stop the display service first so it releases the screen
-        stop_res = subprocess.run(
+        stop_res = await _run_command(
             ["sudo", "systemctl", "stop", "ndi-display"],
-            capture_output=True,
             timeout=10
         )
         logging.getLogger("app").info(f"Stopped ndi-display: {stop_res.stdout} {stop_res.stderr}")
 
         # Wait longer to ensure display is released
-        time.sleep(2.0)
+        await asyncio.sleep(2.0)
 
         # Try setting the mode with --fb set to the largest mode
         set_cmd = [
             "xrandr", "--output", output_name, "--mode", resolution, "--fb", largest_mode
         ]
-        result = subprocess.run(
+        result = await _run_command(
             set_cmd,
-            capture_output=True,
             text=True,
             timeout=10,
             env={**os.environ, "DISPLAY": ":0"}
@@ -619,9 +837,8 @@ def set_resolution(payload: dict):
         if result.returncode != 0:
             # Try alternative: set mode without --fb
             alt_cmd = ["xrandr", "--output", output_name, "--mode", resolution]
-            result2 = subprocess.run(
+            result2 = await _run_command(
                 alt_cmd,
-                capture_output=True,
                 text=True,
                 timeout=10,
                 env={**os.environ, "DISPLAY": ":0"}
@@ -629,13 +846,12 @@ def set_resolution(payload: dict):
             logging.getLogger("app").warning(f"xrandr fallback: {alt_cmd} -> {result2.stdout} {result2.stderr}")
             if result2.returncode != 0:
                 # Try to restart display service even if xrandr failed
-                subprocess.run(["sudo", "systemctl", "start", "ndi-display"], capture_output=True, timeout=10)
+                await _run_command(["sudo", "systemctl", "start", "ndi-display"], timeout=10)
                 raise HTTPException(status_code=500, detail=f"xrandr failed: {result.stderr or result2.stderr}")
 
         # Restart the display service to pick up new resolution
-        start_res = subprocess.run(
+        start_res = await _run_command(
             ["sudo", "systemctl", "start", "ndi-display"],
-            capture_output=True,
             timeout=10
         )
         logging.getLogger("app").info(f"Started ndi-display: {start_res.stdout} {start_res.stderr}")
@@ -643,31 +859,38 @@ def set_resolution(payload: dict):
         logging.getLogger("app").info(f"Resolution set to: {resolution}")
         return {"ok": True, "resolution": resolution}
     except subprocess.TimeoutExpired:
-        subprocess.run(["sudo", "systemctl", "start", "ndi-display"], capture_output=True, timeout=10)
+        await _run_command(["sudo", "systemctl", "start", "ndi-display"], timeout=10)
         raise HTTPException(status_code=500, detail="xrandr timed out")
     except HTTPException:
         raise
     except Exception as e:
         logging.getLogger("app").warning(f"Failed to set resolution: {e}")
-        subprocess.run(["sudo", "systemctl", "start", "ndi-display"], capture_output=True, timeout=10)
+        await _run_command(["sudo", "systemctl", "start", "ndi-display"], timeout=10)
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @app.get("/api/logs")
-def get_logs():
-    return {"logs": ring_handler.snapshot()}
+def get_logs(since: int = 0):
+    """Return buffered log records, optionally only those with id > since."""
+    return {"logs": ring_handler.snapshot(since_id=since)}
+
+
+# Static multipart framing for the MJPEG stream, encoded once
+_MJPEG_PART_HEAD = b"--frame\r\nContent-Type: image/jpeg\r\nContent-Length: "
+_MJPEG_HEADER_END = b"\r\n\r\n"
+_MJPEG_PART_END = b"\r\n"
 
 
 @app.get("/mjpeg")
-def mjpeg():
-    def gen():
-        boundary = b"frame"
+async def mjpeg():
+    async def gen():
         while True:
-            with receiver_lock:
-                r = receiver
+            # Plain read: receiver_lock can be held for seconds while
+            # /api/select connects, and we must not block the event loop
+            r = receiver
 
             if r is None:
-                time.sleep(0.1)
+                await asyncio.sleep(0.1)
                 continue
 
             with settings_lock:
@@ -675,17 +898,15 @@ def mjpeg():
                 w = int(output_width)
                 h = int(output_height)
 
-            frame = r.get_jpeg_frame(timeout_ms=1000, jpeg_quality=q, output_width=w, output_height=h)
+            # Capture/encode blocks, so run it off the event loop
+            frame = await asyncio.to_thread(r.get_jpeg_frame, 1000, q, w, h)
             if frame is None:
-                time.sleep(0.01)
+                await asyncio.sleep(0.01)
                 continue
 
-            yield (
-                b"--" + boundary + b"\r\n"
-                b"Content-Type: image/jpeg\r\n"
-                b"Content-Length: " + str(len(frame)).encode("ascii") + b"\r\n\r\n" +
-                frame + b"\r\n"
-            )
+            yield b"".join((
+                _MJPEG_PART_HEAD, b"%d" % len(frame), _MJPEG_HEADER_END, frame, _MJPEG_PART_END
+            ))
 
     return StreamingResponse(gen(), media_type="multipart/x-mixed-replace; boundary=frame")
 
@@ -3,7 +3,10 @@ Direct HDMI display for NDI streams on Raspberry Pi
 Renders video frames directly to the framebuffer without browser overhead
 """
 import os
+import queue
+import re
 import socket
+import threading
 import time
 import json
 import signal
@@ -14,7 +17,82 @@ from typing import Optional
 import pygame
 import numpy as np
 
-from ndi import NDIReceiver, NDISourceFinder
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+from ndi import NDIReceiver, NDISourceFinder, NDIlib_recv_color_format_BGRX_BGRA
+
+TEMPLATE_TOKEN_RE = re.compile(r'<(\w+)>')
+
+# Fully faded to black (alpha 255 in the high byte)
+BLANK_ALPHA_MAX = 0xFFFF
+
+# Filter for CPU downscaling of >1080p sources: "nearest" or "bilinear"
+SCALE_FILTER = os.environ.get('NDI_SCALE_FILTER', 'nearest').lower()
+
+# Output bytes each scaler task works on at a time; half the Pi 5's L2 so
+# the strip and the source rows it reads stay cache-resident
+SCALE_STRIP_BYTES = 256 * 1024
+
+
+def _nearest_table(src_len: int, dst_len: int) -> np.ndarray:
+    """Source index under each output pixel's centre"""
+    return ((np.arange(dst_len) * 2 + 1) * src_len // (2 * dst_len)).astype(np.int32)
+
+
+def _strip_rows(dst_w: int, channels: int) -> int:
+    """Output rows per scaler strip for a given row width"""
+    return max(1, SCALE_STRIP_BYTES // (dst_w * channels))
+
+
+def _bilinear_table(src_len: int, dst_len: int) -> tuple:
+    """Source index pair and 8-bit weight of the upper one for each output pixel"""
+    pos = (np.arange(dst_len) + 0.5) * (src_len / dst_len) - 0.5
+    pos = np.clip(pos, 0, src_len - 1)
+    lo = np.floor(pos).astype(np.int32)
+    hi = np.minimum(lo + 1, src_len - 1).astype(np.int32)
+    w = np.round((pos - lo) * 256).astype(np.int32)
+    return lo, hi, w
+
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _scale_nearest_numba(src: np.ndarray, dst: np.ndarray, strip_rows: int,
+                             row_idx: np.ndarray, col_idx: np.ndarray):
+        """Numba JIT-compiled nearest-neighbour scale of packed pixels into dst"""
+        height = dst.shape[0]
+        for strip in prange((height + strip_rows - 1) // strip_rows):
+            for y in range(strip * strip_rows, min(height, (strip + 1) * strip_rows)):
+                sy = row_idx[y]
+                for x in range(dst.shape[1]):
+                    sx = col_idx[x]
+                    for c in range(dst.shape[2]):
+                        dst[y, x, c] = src[sy, sx, c]
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _scale_bilinear_numba(src: np.ndarray, dst: np.ndarray, strip_rows: int,
+                              row_lo: np.ndarray, row_hi: np.ndarray, row_w: np.ndarray,
+                              col_lo: np.ndarray, col_hi: np.ndarray, col_w: np.ndarray):
+        """Numba JIT-compiled bilinear scale into dst (8.8 fixed-point weights)"""
+        height = dst.shape[0]
+        for strip in prange((height + strip_rows - 1) // strip_rows):
+            for y in range(strip * strip_rows, min(height, (strip + 1) * strip_rows)):
+                y0 = row_lo[y]
+                y1 = row_hi[y]
+                wy = row_w[y]
+                iwy = 256 - wy
+                for x in range(dst.shape[1]):
+                    x0 = col_lo[x]
+                    x1 = col_hi[x]
+                    wx = col_w[x]
+                    iwx = 256 - wx
+                    for c in range(dst.shape[2]):
+                        top = src[y0, x0, c] * iwx + src[y0, x1, c] * wx
+                        bottom = src[y1, x0, c] * iwx + src[y1, x1, c] * wx
+                        dst[y, x, c] = (top * iwy + bottom * wy + 32768) >> 16
 
 # Configuration file for persistence
 CONFIG_FILE = Path.home() / ".ndi-monitor-config.json"
@@ -31,26 +109,78 @@ class NDIDisplay:
         self.no_connection_subtext = "Configure via web interface"
         self.hdmi_blank = False
         self._prev_hdmi_blank = False
-        self.blank_alpha = 0.0  # 0..255
+        self.blank_alpha_q16 = 0  # fade alpha in 8.8 fixed point, 0..BLANK_ALPHA_MAX
         self.show_fps = True  # Toggle for FPS overlay
         self.blank_transition_ms = 400
-        self.overlay = None
-        self._last_alpha_ts = time.time()
+        self._last_alpha_ns = time.monotonic_ns()
         self._fade_full_emitted = False
         self._fade_clear_emitted = False
         # FPS tracking
         self._fps_count = 0
-        self._fps_last_ts = time.time()
-        self._fps_value = 0.0
+        self._fps_last_ns = time.monotonic_ns()
+        self._fps_value = 0
         self._fps_font = None
-        self.last_config_check = 0
-        self.config_check_interval = 1.00  # Check config ~1x/sec for responsiveness
+        self._fps_cached_value = -1
+        self._fps_surf = None
+        # Fonts by size, and rendered text surfaces by (text, size, color)
+        self._font_cache = {}
+        self._text_cache = {}
+        # Host lookups for message templates, refreshed every 30s
+        self._cached_ip = None
+        self._cached_hostname = None
+        self._host_info_ts = 0.0
+        self.host_info_interval = 30.0
+        # Templates pre-split into alternating literal / token parts
+        self._template_parts = {}
+        # Config file is watched on a background thread (a stat() per tick,
+        # parsed only when the mtime changes); parsed configs are handed to
+        # the render loop through this queue
+        self.config_check_interval = 0.25
+        self._config_queue: queue.SimpleQueue = queue.SimpleQueue()
+        # Set when there is something for an idle render loop to act on
+        # (new config, shutdown); idle states wait on it instead of polling
+        self._wake_event = threading.Event()
+        self.idle_wait_blanked = 0.25
+        self.idle_wait_message = 0.2
         
         # Frame buffer caching for performance
         self._cached_frame_size = (0, 0)
         self._cached_scaled_size = (0, 0)
         self._frame_surface = None
         self._scaled_surface = None
+        # Numba scaler: output array shared with _scaled_surface via
+        # frombuffer, and source row/column tables per geometry (index maps
+        # for nearest; lo/hi index and weight arrays for bilinear)
+        self._scaled_buf = None
+        self._row_table = None
+        self._col_table = None
+        self._strip_rows = 1
+        # (surface, dest) pairs composited once per frame via Surface.blits()
+        self._blit_list = []
+        # Letterbox bars are filled once per geometry change, not every frame
+        self._letterbox_cleared = False
+        self._fps_rect = None
+        # Presentation state: the display is only flipped when something on
+        # it changed (new video frame, fade step, FPS text, message text)
+        self._screen_dirty = False
+        # Regions changed this frame (_dirty_full: the whole screen). Without
+        # DOUBLEBUF these are presented with display.update(rects)
+        self._dirty_rects = []
+        self._dirty_full = False
+        self._use_dirty_rects = False
+        self._fps_drawn_rect = None
+        self._screen_state = None  # "blank", "message" or "video"
+        self._presented_alpha = 0
+        self._presented_fps = None
+        self._presented_messages = None
+        # Last video blit, re-presented when the fade or FPS text changes
+        # between NDI frames (the frame array backs a frombuffer surface)
+        self._last_video_blit = None
+        self._last_video_frame = None
+        # Receive buffers, alternated each frame: NDI copies into one while
+        # the other still backs the last presented surface
+        self._rx_bufs = [None, None]
+        self._rx_index = 0
         
         # Load saved configuration
         self.load_config()
@@ -72,22 +202,16 @@ class NDIDisplay:
         
         # Force 1080p rendering for performance - display will upscale
         # This dramatically reduces CPU usage compared to 4K rendering
-        self.width = 1920
-        self.height = 1080
+        self.max_render_size = (1920, 1080)
+        self.width, self.height = self.max_render_size
+        self._display_flags = pygame.FULLSCREEN | pygame.HWSURFACE | pygame.SCALED
+        # Page flipping is the default; backends that fall back to a software
+        # surface present partial frames cheaper with dirty-rect updates
+        if os.environ.get('NDI_DISPLAY_DOUBLEBUF', '1') != '0':
+            self._display_flags |= pygame.DOUBLEBUF
         
-        self.screen = pygame.display.set_mode(
-            (self.width, self.height),
-            pygame.FULLSCREEN | pygame.HWSURFACE | pygame.DOUBLEBUF | pygame.SCALED
-        )
-        
-        # Prepare overlay for fade-to-black using constant alpha
-        try:
-            self.overlay = pygame.Surface((self.width, self.height))
-            self.overlay.fill((0, 0, 0))
-            print("🟦 Overlay surface ready for fade")
-        except Exception as e:
-            print(f"⚠️  Overlay init failed: {e}")
-            self.overlay = None
+        self.screen = pygame.display.set_mode((self.width, self.height), self._display_flags)
+        self._use_dirty_rects = not (self.screen.get_flags() & pygame.DOUBLEBUF)
         
         pygame.mouse.set_visible(False)
         pygame.display.set_caption("NDI Monitor")
@@ -98,6 +222,22 @@ class NDIDisplay:
         
         print(f"✅ Display initialized: {self.width}x{self.height} (driver={driver})")
 
+    def set_render_size(self, size: tuple):
+        """Switch the logical render size.
+        With SCALED, SDL stretches the logical surface to the screen on the
+        GPU (letterboxed), so frames rendered at their native size need no
+        CPU scaling at all.
+        """
+        if size == (self.width, self.height):
+            return
+        self.screen = pygame.display.set_mode(size, self._display_flags)
+        self._use_dirty_rects = not (self.screen.get_flags() & pygame.DOUBLEBUF)
+        self.width, self.height = size
+        self._fps_drawn_rect = None
+        # Scaled geometry depends on the render size
+        self._cached_frame_size = (0, 0)
+        print(f"🖥️  Render size: {self.width}x{self.height}")
+
     def get_local_ip(self) -> str:
         """Best-effort to get the primary local IP address"""
         try:
@@ -112,23 +252,48 @@ class NDIDisplay:
             except Exception:
                 return "127.0.0.1"
 
+    def refresh_host_info(self):
+        """Refresh the cached IP address and hostname when they go stale"""
+        now = time.time()
+        if self._cached_ip is not None and now - self._host_info_ts < self.host_info_interval:
+            return
+        self._host_info_ts = now
+        self._cached_ip = self.get_local_ip()
+        try:
+            self._cached_hostname = socket.gethostname()
+        except Exception:
+            self._cached_hostname = ""
+
     def format_template(self, template: str) -> str:
         """Replace variable tokens in the message template"""
         if not template:
             return template
+        msg = str(template)
+        parts = self._template_parts.get(msg)
+        if parts is None:
+            # Even indexes are literals, odd indexes are token names
+            parts = TEMPLATE_TOKEN_RE.split(msg)
+            self._template_parts[msg] = parts
+        if len(parts) == 1:
+            return msg
+        tokens = parts[1::2]
+        if "ip" in tokens or "hostname" in tokens:
+            self.refresh_host_info()
+        width = getattr(self, 'width', 0)
+        height = getattr(self, 'height', 0)
         context = {
-            "ip": self.get_local_ip(),
-            "hostname": socket.gethostname(),
+            "ip": self._cached_ip,
+            "hostname": self._cached_hostname,
             "source": self.selected_source or "",
-            "width": str(getattr(self, 'width', 0)),
-            "height": str(getattr(self, 'height', 0)),
-            "resolution": f"{getattr(self, 'width', 0)}x{getattr(self, 'height', 0)}",
-            "time": time.strftime("%H:%M:%S"),
+            "width": str(width),
+            "height": str(height),
+            "resolution": f"{width}x{height}",
+            "time": time.strftime("%H:%M:%S") if "time" in tokens else "",
         }
-        msg = str(template)
-        for k, v in context.items():
-            msg = msg.replace(f"<{k}>", v)
-        return msg
+        return "".join(
+            part if i % 2 == 0 else context.get(part, f"<{part}>")
+            for i, part in enumerate(parts)
+        )
     
     def load_config(self):
         try:
@@ -147,49 +312,71 @@ class NDIDisplay:
         except Exception as e:
             print(f"⚠️  Could not load config: {e}")
 
+    def watch_config(self):
+        """Background thread: push the config whenever the file changes"""
+        last_mtime = None
+        while self.running:
+            try:
+                mtime = os.stat(CONFIG_FILE).st_mtime_ns
+                if mtime != last_mtime:
+                    with open(CONFIG_FILE, 'r') as f:
+                        config = json.load(f)
+                    last_mtime = mtime
+                    self._config_queue.put(config)
+                    self._wake_event.set()
+            except Exception:
+                pass  # Ignore config read errors; retried next tick
+            time.sleep(self.config_check_interval)
+
     def check_config_update(self):
-        """Check if configuration has been updated via web interface"""
-        current_time = time.time()
-        if current_time - self.last_config_check < self.config_check_interval:
+        """Apply the latest configuration pushed by the watcher thread"""
+        config = None
+        try:
+            while True:
+                config = self._config_queue.get_nowait()
+        except queue.Empty:
+            pass
+        if config is None:
             return
         
-        self.last_config_check = current_time
-        
         try:
-            if CONFIG_FILE.exists():
-                with open(CONFIG_FILE, 'r') as f:
-                    config = json.load(f)
-                    new_source = config.get('selected_source')
-                    self.no_connection_message = config.get('no_connection_message', self.no_connection_message)
-                    self.no_connection_subtext = config.get('no_connection_subtext', self.no_connection_subtext)
-                    self.show_fps = config.get('show_fps', True)
-                    new_blank = bool(config.get('hdmi_blank', self.hdmi_blank))
-                    if new_blank != self.hdmi_blank:
-                        self.hdmi_blank = new_blank
-                        self._prev_hdmi_blank = new_blank
-                        # Reset fade completion flags when state changes
-                        self._fade_full_emitted = False
-                        self._fade_clear_emitted = False
-                        print(f"🌓 HDMI blank changed: {self.hdmi_blank}")
-                    
-                    if new_source != self.selected_source:
-                        print(f"🔄 Source changed to: {new_source}")
-                        self.selected_source = new_source
-                        self.connect_to_source()
+            new_source = config.get('selected_source')
+            self.no_connection_message = config.get('no_connection_message', self.no_connection_message)
+            self.no_connection_subtext = config.get('no_connection_subtext', self.no_connection_subtext)
+            self.show_fps = config.get('show_fps', True)
+            new_blank = bool(config.get('hdmi_blank', self.hdmi_blank))
+            if new_blank != self.hdmi_blank:
+                self.hdmi_blank = new_blank
+                self._prev_hdmi_blank = new_blank
+                # Reset fade completion flags when state changes
+                self._fade_full_emitted = False
+                self._fade_clear_emitted = False
+                print(f"🌓 HDMI blank changed: {self.hdmi_blank}")
+            
+            if new_source != self.selected_source:
+                print(f"🔄 Source changed to: {new_source}")
+                self.selected_source = new_source
+                self.connect_to_source()
         except Exception as e:
-            pass  # Ignore config read errors
+            pass  # Ignore malformed config
     
     def connect_to_source(self):
         """Connect to the selected NDI source"""
         if self.receiver:
             self.receiver.close()
             self.receiver = None
+        self._last_video_blit = None
+        self._last_video_frame = None
         
         if not self.selected_source:
             return
         
         try:
-            self.receiver = NDIReceiver(source_name=self.selected_source)
+            # Have the SDK decode straight to the display's 32-bit layout
+            self.receiver = NDIReceiver(
+                source_name=self.selected_source,
+                color_format=NDIlib_recv_color_format_BGRX_BGRA,
+            )
             print(f"✅ Connected to: {self.selected_source}")
         except Exception as e:
             print(f"❌ Failed to connect to {self.selected_source}: {e}")
@@ -212,116 +399,286 @@ class NDIDisplay:
     def render_text(self, text: str, y_offset: int = 0, font_size: int = 56, color: tuple = (80, 80, 80)):
         """Render centered text on screen"""
         try:
-            font = pygame.font.Font(None, font_size)
-            text_surface = font.render(text, True, color)
+            key = (text, font_size, color)
+            text_surface = self._text_cache.get(key)
+            if text_surface is None:
+                font = self._font_cache.get(font_size)
+                if font is None:
+                    font = self._font_cache[font_size] = pygame.font.Font(None, font_size)
+                text_surface = font.render(text, True, color)
+                # Templates with <time> produce a new string every second;
+                # keep the cache bounded
+                if len(self._text_cache) >= 16:
+                    self._text_cache.clear()
+                self._text_cache[key] = text_surface
             text_rect = text_surface.get_rect(center=(self.width // 2, self.height // 2 + y_offset))
             self.screen.blit(text_surface, text_rect)
         except Exception:
             pass
     
+    def fill_letterbox(self, x: int, y: int, w: int, h: int):
+        """Fill the black bars around a video rect at (x, y) of size w x h"""
+        bars = (
+            (0, 0, self.width, y),                           # top
+            (0, y + h, self.width, self.height - y - h),     # bottom
+            (0, y, x, h),                                    # left
+            (x + w, y, self.width - x - w, h),               # right
+        )
+        for bar in bars:
+            if bar[2] > 0 and bar[3] > 0:
+                self.screen.fill((0, 0, 0), bar)
+
+    def mark_dirty(self, rect=None):
+        """Flag a screen region (or the whole screen) as changed this frame"""
+        self._screen_dirty = True
+        if rect is None:
+            self._dirty_full = True
+        elif not self._dirty_full:
+            self._dirty_rects.append(rect)
+
+    def step_fade(self, now: int) -> int:
+        """Advance the fade-to-black transition; returns the alpha (0..255)"""
+        # Integer-only stepping: the full range takes blank_transition_ms
+        dt_ns = now - self._last_alpha_ns
+        self._last_alpha_ns = now
+        step = BLANK_ALPHA_MAX * dt_ns // (self.blank_transition_ms * 1_000_000)
+        if self.hdmi_blank:
+            self.blank_alpha_q16 = min(BLANK_ALPHA_MAX, self.blank_alpha_q16 + step)
+            if self.blank_alpha_q16 >= 254 << 8 and not self._fade_full_emitted:
+                self.blank_alpha_q16 = BLANK_ALPHA_MAX
+                self._fade_full_emitted = True
+                self._fade_clear_emitted = False
+                print("🌑 Fade complete: black")
+        else:
+            self.blank_alpha_q16 = max(0, self.blank_alpha_q16 - step)
+            if self.blank_alpha_q16 <= 1 << 8 and not self._fade_clear_emitted:
+                self.blank_alpha_q16 = 0
+                self._fade_clear_emitted = True
+                self._fade_full_emitted = False
+                print("🌕 Fade cleared: video visible")
+        return self.blank_alpha_q16 >> 8
+
+    def update_fps(self, now: int) -> bool:
+        """Update the FPS value and text; returns True if the overlay changed"""
+        elapsed = now - self._fps_last_ns
+        if elapsed >= 1_000_000_000:
+            self._fps_value = self._fps_count * 1_000_000_000 // elapsed
+            self._fps_last_ns = now
+            self._fps_count = 0
+        fv = self._fps_value
+        if self.show_fps and self._fps_font and fv != self._fps_cached_value:
+            # Text only changes when the integer value does (~1x/sec)
+            self._fps_surf = self._fps_font.render(f"FPS: {fv}", True, (180, 180, 180))
+            self._fps_cached_value = fv
+            self._fps_rect = self._fps_surf.get_rect(topleft=(12, 10))
+        key = (self.show_fps, fv)
+        changed = key != self._presented_fps
+        self._presented_fps = key
+        return changed
+
+    def scale_surface(self, pygame_img, frame_size: tuple):
+        """Scale to cached size, into a surface reused across frames"""
+        if self._cached_scaled_size == frame_size:
+            return pygame_img
+        if self._scaled_surface is None:
+            # transform.scale needs dest in the source's pixel format
+            self._scaled_surface = pygame.Surface(self._cached_scaled_size, 0, pygame_img)
+            self._scaled_surface.set_alpha(None)
+        if SCALE_FILTER == 'bilinear':
+            return pygame.transform.smoothscale(pygame_img, self._cached_scaled_size, self._scaled_surface)
+        return pygame.transform.scale(pygame_img, self._cached_scaled_size, self._scaled_surface)
+
     def render_frame(self):
         """Get and render a frame from NDI receiver (optimized)"""
-        # If fully blanked, skip expensive frame processing but maintain frame rate
-        fully_blanked = self.hdmi_blank and self.blank_alpha >= 255.0
+        blit_list = self._blit_list
+        blit_list.clear()
+        # One clock sample per frame, shared by the fade and FPS counters
+        now = time.monotonic_ns()
+
+        # Fade and FPS state changing means the screen must be presented
+        # again even without a new NDI frame
+        try:
+            a = self.step_fade(now)
+        except Exception as e:
+            print(f"⚠️  Fade error: {e}")
+            a = 255 if self.hdmi_blank else 0
+        try:
+            fps_changed = self.update_fps(now)
+        except Exception:
+            fps_changed = False
+        redraw = a != self._presented_alpha or fps_changed
+
+        # If fully blanked, skip expensive frame processing
+        fully_blanked = self.hdmi_blank and self.blank_alpha_q16 >= BLANK_ALPHA_MAX
         
         if fully_blanked:
-            # Just fill black, skip NDI frame processing
-            self.screen.fill((0, 0, 0))
-            time.sleep(0.002)  # Minimal sleep, let vsync handle timing
+            if redraw or self._screen_state != "blank":
+                self.screen.fill((0, 0, 0))
+                self._letterbox_cleared = False
+                self._screen_state = "blank"
+                self.mark_dirty()
         elif not self.receiver:
-            # No connection - show message
-            self.screen.fill((0, 0, 0))
-            self.render_text(self.format_template(self.no_connection_message) or "No NDI Source", 0, font_size=45, color=(80, 80, 80))
-            if self.no_connection_subtext:
-                self.render_text(self.format_template(self.no_connection_subtext), 50, font_size=32, color=(60, 60, 60))
+            # No connection - show message at the full render size
+            if (self.width, self.height) != self.max_render_size:
+                self.set_render_size(self.max_render_size)
+            messages = (
+                self.format_template(self.no_connection_message) or "No NDI Source",
+                self.format_template(self.no_connection_subtext) if self.no_connection_subtext else "",
+            )
+            if redraw or self._screen_state != "message" or messages != self._presented_messages:
+                self.screen.fill((0, 0, 0))
+                self._letterbox_cleared = False
+                self.render_text(messages[0], 0, font_size=45, color=(80, 80, 80))
+                if messages[1]:
+                    self.render_text(messages[1], 50, font_size=32, color=(60, 60, 60))
+                self._presented_messages = messages
+                self._screen_state = "message"
+                self.mark_dirty()
         else:
             try:
-                # Get raw RGB frame for higher throughput
-                result = self.receiver.get_rgb_frame(timeout_ms=16)
-                if result is None:
-                    # No frame available; light sleep to avoid busy-wait
-                    time.sleep(0.002)
-                else:
-                    rgb_array, (fw, fh) = result
+                # Get the raw BGRA frame: no per-pixel conversion anywhere
+                result = self.receiver.get_bgra_frame(timeout_ms=16, out=self._rx_bufs[self._rx_index])
+                if result is not None:
+                    bgra_array, (fw, fh) = result
+                    self._rx_bufs[self._rx_index] = bgra_array
+                    self._rx_index ^= 1
                     frame_size = (fw, fh)
                     
                     # Recalculate scaled size if frame size changed
                     if self._cached_frame_size != frame_size:
+                        # Sources that fit in 1080p render at native size and
+                        # are upscaled by SDL on the GPU; larger ones are still
+                        # downscaled on the CPU so we never upload >1080p textures
+                        max_w, max_h = self.max_render_size
+                        target = frame_size if fw <= max_w and fh <= max_h else self.max_render_size
+                        try:
+                            self.set_render_size(target)
+                        except Exception as e:
+                            print(f"⚠️  Render size change failed: {e}")
                         self._cached_frame_size = frame_size
                         scale = min(self.width / fw, self.height / fh)
                         self._cached_scaled_size = (int(fw * scale), int(fh * scale))
+                        self._scaled_surface = None
+                        self._scaled_buf = None
+                        self._letterbox_cleared = False
                     
-                    # Create surface from RGB buffer (pygame handles format correctly)
-                    pygame_img = pygame.image.frombuffer(rgb_array.tobytes(), frame_size, "RGB")
-                    
-                    # Scale to cached size
-                    if self._cached_scaled_size != frame_size:
-                        scaled_img = pygame.transform.scale(pygame_img, self._cached_scaled_size)
+                    if NUMBA_AVAILABLE and self._cached_scaled_size != frame_size:
+                        # Scale straight from the NDI array into a persistent
+                        # buffer that the blitted surface shares
+                        if self._scaled_buf is None:
+                            sw, sh = self._cached_scaled_size
+                            if SCALE_FILTER == 'bilinear':
+                                self._row_table = _bilinear_table(fh, sh)
+                                self._col_table = _bilinear_table(fw, sw)
+                            else:
+                                self._row_table = (_nearest_table(fh, sh),)
+                                self._col_table = (_nearest_table(fw, sw),)
+                            self._scaled_buf = np.zeros((sh, sw, 4), dtype=np.uint8)
+                            self._strip_rows = _strip_rows(sw, 4)
+                            self._scaled_surface = pygame.image.frombuffer(self._scaled_buf, (sw, sh), "BGRA")
+                            self._scaled_surface.set_alpha(None)
+                        if SCALE_FILTER == 'bilinear':
+                            _scale_bilinear_numba(bgra_array, self._scaled_buf, self._strip_rows, *self._row_table, *self._col_table)
+                        else:
+                            _scale_nearest_numba(bgra_array, self._scaled_buf, self._strip_rows, *self._row_table, *self._col_table)
+                        scaled_img = self._scaled_surface
                     else:
-                        scaled_img = pygame_img
+                        # Wrap the array's own memory (no tobytes() copy); frombuffer
+                        # needs packed rows, which is a no-op for contiguous frames
+                        if not bgra_array.flags.c_contiguous:
+                            bgra_array = np.ascontiguousarray(bgra_array)
+                        pygame_img = pygame.image.frombuffer(bgra_array, frame_size, "BGRA")
+                        # Video is opaque: disable per-pixel alpha so blits take
+                        # the plain 32-bit copy path (and BGRX padding is ignored)
+                        pygame_img.set_alpha(None)
+                        scaled_img = self.scale_surface(pygame_img, frame_size)
                     
                     # Center on screen
                     x = (self.width - self._cached_scaled_size[0]) // 2
                     y = (self.height - self._cached_scaled_size[1]) // 2
-                    
-                    # Render
-                    self.screen.fill((0, 0, 0))
-                    self.screen.blit(scaled_img, (x, y))
+                    self._last_video_blit = (scaled_img, (x, y))
+                    self._last_video_frame = bgra_array
+                    self._screen_dirty = True
+                elif redraw or self._screen_state != "video":
+                    if self._last_video_blit is None:
+                        self.screen.fill((0, 0, 0))
+                        self._letterbox_cleared = False
+                        self.mark_dirty()
+                    self._screen_dirty = True
+                
+                if self._screen_dirty:
+                    self._screen_state = "video"
+                    if self._last_video_blit is not None:
+                        # Render; the video overwrites its own area, so only the
+                        # letterbox bars need clearing, and only when they change
+                        if not self._letterbox_cleared:
+                            self.fill_letterbox(*self._last_video_blit[1], *self._cached_scaled_size)
+                            self._letterbox_cleared = True
+                            self.mark_dirty()
+                        elif self._fps_drawn_rect is not None:
+                            # FPS text may sit on a bar; erase last frame's
+                            self.screen.fill((0, 0, 0), self._fps_drawn_rect)
+                            self.mark_dirty(self._fps_drawn_rect)
+                        blit_list.append(self._last_video_blit)
+                        self.mark_dirty(pygame.Rect(self._last_video_blit[1], self._cached_scaled_size))
             except Exception as e:
                 print(f"⚠️  Frame render error: {e}")
                 time.sleep(0.01)
 
-        # Apply fade-to-black overlay
-        try:
-            now = time.time()
-            dt = max(0.0, now - (self._last_alpha_ts or now))
-            self._last_alpha_ts = now
-            step = 255.0 * dt / (self.blank_transition_ms / 1000.0)
-            if self.hdmi_blank:
-                self.blank_alpha = min(255.0, self.blank_alpha + step)
-                if self.blank_alpha >= 254.0 and not self._fade_full_emitted:
-                    self.blank_alpha = 255.0
-                    self._fade_full_emitted = True
-                    self._fade_clear_emitted = False
-                    print("🌑 Fade complete: black")
+        if not self._screen_dirty:
+            # Nothing changed on screen; skip the (vsync-blocking) flip. With
+            # video the capture call usually blocked for the frame interval,
+            # but it returns at once on status/error frames or a lost source,
+            # so back off briefly; idle states sleep until woken or their
+            # next periodic redraw
+            if self._screen_state in ("blank", "message"):
+                timeout = self.idle_wait_blanked if self._screen_state == "blank" else self.idle_wait_message
             else:
-                self.blank_alpha = max(0.0, self.blank_alpha - step)
-                if self.blank_alpha <= 1.0 and not self._fade_clear_emitted:
-                    self.blank_alpha = 0.0
-                    self._fade_clear_emitted = True
-                    self._fade_full_emitted = False
-                    print("🌕 Fade cleared: video visible")
-
-            if self.overlay is not None:
-                a = int(self.blank_alpha)
-                if a > 0:
-                    self.overlay.set_alpha(a)
-                    self.screen.blit(self.overlay, (0, 0))
-            elif self.hdmi_blank:
-                # Fallback if overlay isn't supported
-                self.screen.fill((0, 0, 0))
+                timeout = 0.002
+            if self._wake_event.wait(timeout):
+                self._wake_event.clear()
+            return
+
+        # Apply fade-to-black
+        try:
+            if a > 0:
+                # The video must be on screen before it is darkened
+                if blit_list:
+                    self.screen.blits(blit_list, doreturn=False)
+                    blit_list.clear()
+                # Multiply by a constant grey: a solid fill on SDL's fast path,
+                # much cheaper than a full-screen per-pixel alpha blit
+                shade = 255 - a
+                self.screen.fill((shade, shade, shade), special_flags=pygame.BLEND_RGB_MULT)
+                self.mark_dirty()
         except Exception as e:
             print(f"⚠️  Fade error: {e}")
             if self.hdmi_blank:
+                blit_list.clear()
                 self.screen.fill((0, 0, 0))
+                self.mark_dirty()
 
-        # Update and draw FPS overlay (before flip)
-        try:
-            self._fps_count += 1
-            now = time.time()
-            if now - self._fps_last_ts >= 1.0:
-                elapsed = now - self._fps_last_ts
-                self._fps_value = self._fps_count / max(elapsed, 1e-3)
-                self._fps_last_ts = now
-                self._fps_count = 0
-            if self.show_fps and self._fps_font:
-                fps_text = f"FPS: {int(self._fps_value)}"
-                surf = self._fps_font.render(fps_text, True, (180, 180, 180))
-                self.screen.blit(surf, (12, 10))
-        except Exception:
-            pass
+        # Draw FPS overlay (before flip)
+        if self.show_fps and self._fps_surf is not None:
+            blit_list.append((self._fps_surf, (12, 10)))
+            self._fps_drawn_rect = self._fps_rect
+            self.mark_dirty(self._fps_rect)
+        else:
+            self._fps_drawn_rect = None
+
+        # Video and FPS text in a single call into SDL
+        if blit_list:
+            self.screen.blits(blit_list, doreturn=False)
         
-        pygame.display.flip()
+        if self._use_dirty_rects and not self._dirty_full:
+            pygame.display.update(self._dirty_rects)
+        else:
+            pygame.display.flip()
+        self._dirty_rects.clear()
+        self._dirty_full = False
+        self._presented_alpha = a
+        self._screen_dirty = False
+        self._fps_count += 1
     
     def run(self):
         """Main display loop"""
@@ -335,6 +692,8 @@ class NDIDisplay:
         
         clock = pygame.time.Clock()
         
+        threading.Thread(target=self.watch_config, name="config-watcher", daemon=True).start()
+        
         while self.running:
             # Handle pygame events
             for event in pygame.event.get():
@@ -358,6 +717,7 @@ class NDIDisplay:
         """Handle shutdown signals"""
         print(f"\n⚠️  Received signal {signum}, shutting down...")
         self.running = False
+        self._wake_event.set()
     
     def cleanup(self):
         """Clean up resources"""
@@ -4,10 +4,12 @@ This uses the actual libndi.dylib library to discover and receive NDI sources.
 """
 import ctypes
 import ctypes.util
+import functools
 import os
 from pathlib import Path
 import threading
 import time
+from contextlib import contextmanager
 from dataclasses import dataclass
 from io import BytesIO
 from typing import List, Optional
@@ -53,6 +55,132 @@ def _load_ndi_lib() -> ctypes.CDLL:
     )
 
 
+def _load_swscale_lib() -> Optional[ctypes.CDLL]:
+    """Load FFmpeg's libswscale if present (optional, for UYVY conversion)"""
+    candidates = [
+        "/opt/homebrew/lib/libswscale.dylib",
+        "/usr/local/lib/libswscale.dylib",
+        "libswscale.dylib",
+    ]
+    found = ctypes.util.find_library("swscale")
+    if found:
+        candidates.append(found)
+    
+    # Check environment variable override
+    override = os.environ.get("SWSCALE_LIB_PATH")
+    if override:
+        candidates.insert(0, override)
+    
+    for path in candidates:
+        try:
+            lib = ctypes.CDLL(path)
+        except OSError:
+            continue
+        
+        lib.sws_getCachedContext.argtypes = [
+            ctypes.c_void_p,                            # context to reuse
+            ctypes.c_int, ctypes.c_int, ctypes.c_int,   # srcW, srcH, srcFormat
+            ctypes.c_int, ctypes.c_int, ctypes.c_int,   # dstW, dstH, dstFormat
+            ctypes.c_int,                               # flags
+            ctypes.c_void_p, ctypes.c_void_p,           # srcFilter, dstFilter
+            ctypes.c_void_p,                            # param
+        ]
+        lib.sws_getCachedContext.restype = ctypes.c_void_p
+        lib.sws_scale.argtypes = [
+            ctypes.c_void_p,
+            ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
+            ctypes.POINTER(ctypes.c_int),
+            ctypes.c_int,
+            ctypes.c_int,
+            ctypes.POINTER(ctypes.POINTER(ctypes.c_uint8)),
+            ctypes.POINTER(ctypes.c_int),
+        ]
+        lib.sws_scale.restype = ctypes.c_int
+        lib.sws_freeContext.argtypes = [ctypes.c_void_p]
+        lib.sws_freeContext.restype = None
+        print(f"✅ Loaded libswscale from: {path}")
+        return lib
+    
+    return None
+
+
+_swscale = _load_swscale_lib()
+SWSCALE_AVAILABLE = _swscale is not None
+
+def _load_turbojpeg_lib() -> Optional[ctypes.CDLL]:
+    """Load libjpeg-turbo's TurboJPEG API if present (optional, for JPEG encoding)"""
+    candidates = [
+        "/opt/homebrew/opt/jpeg-turbo/lib/libturbojpeg.dylib",
+        "/usr/local/opt/jpeg-turbo/lib/libturbojpeg.dylib",
+        "/opt/libjpeg-turbo/lib64/libturbojpeg.dylib",
+        "libturbojpeg.so.0",
+    ]
+    found = ctypes.util.find_library("turbojpeg")
+    if found:
+        candidates.append(found)
+    
+    # Check environment variable override
+    override = os.environ.get("TURBOJPEG_LIB_PATH")
+    if override:
+        candidates.insert(0, override)
+    
+    for path in candidates:
+        try:
+            lib = ctypes.CDLL(path)
+        except OSError:
+            continue
+        
+        lib.tjInitCompress.argtypes = []
+        lib.tjInitCompress.restype = ctypes.c_void_p
+        lib.tjBufSize.argtypes = [ctypes.c_int, ctypes.c_int, ctypes.c_int]
+        lib.tjBufSize.restype = ctypes.c_ulong
+        lib.tjCompress2.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,                            # srcBuf
+            ctypes.c_int, ctypes.c_int, ctypes.c_int,   # width, pitch, height
+            ctypes.c_int,                               # pixelFormat
+            ctypes.POINTER(ctypes.c_void_p),            # jpegBuf
+            ctypes.POINTER(ctypes.c_ulong),             # jpegSize
+            ctypes.c_int, ctypes.c_int, ctypes.c_int,   # jpegSubsamp, jpegQual, flags
+        ]
+        lib.tjCompress2.restype = ctypes.c_int
+        lib.tjCompressFromYUV.argtypes = [
+            ctypes.c_void_p,
+            ctypes.c_void_p,                            # srcBuf
+            ctypes.c_int, ctypes.c_int, ctypes.c_int,   # width, pad, height
+            ctypes.c_int,                               # subsamp
+            ctypes.POINTER(ctypes.c_void_p),            # jpegBuf
+            ctypes.POINTER(ctypes.c_ulong),             # jpegSize
+            ctypes.c_int, ctypes.c_int,                 # jpegQual, flags
+        ]
+        lib.tjCompressFromYUV.restype = ctypes.c_int
+        lib.tjGetErrorStr2.argtypes = [ctypes.c_void_p]
+        lib.tjGetErrorStr2.restype = ctypes.c_char_p
+        lib.tjDestroy.argtypes = [ctypes.c_void_p]
+        lib.tjDestroy.restype = ctypes.c_int
+        print(f"✅ Loaded libturbojpeg from: {path}")
+        return lib
+    
+    return None
+
+
+_turbojpeg = _load_turbojpeg_lib()
+TURBOJPEG_AVAILABLE = _turbojpeg is not None
+
+# TurboJPEG pixel formats / subsampling / flags
+TJPF_RGB = 0
+TJSAMP_422 = 1
+TJFLAG_NOREALLOC = 1024
+TJFLAG_FASTDCT = 2048
+
+# libavutil pixel formats / libswscale flags
+AV_PIX_FMT_RGB24 = 2
+AV_PIX_FMT_UYVY422 = 15
+SWS_POINT = 0x10
+SWS_AREA = 0x20
+SWS_LANCZOS = 0x200
+
+
 # NDI structures and constants
 class NDIlib_source_t(ctypes.Structure):
     _fields_ = [
@@ -78,6 +206,24 @@ class NDIlib_video_frame_v2_t(ctypes.Structure):
     ]
 
 
+class NDIlib_recv_create_v3_t(ctypes.Structure):
+    _fields_ = [
+        ("source_to_connect_to", NDIlib_source_t),
+        ("color_format", ctypes.c_int),
+        ("bandwidth", ctypes.c_int),
+        ("allow_video_fields", ctypes.c_bool),
+        ("p_ndi_recv_name", ctypes.c_char_p),
+    ]
+
+
+# Receiver color formats (what the SDK decodes to)
+NDIlib_recv_color_format_BGRX_BGRA = 0
+NDIlib_recv_color_format_UYVY_BGRA = 1  # SDK default
+NDIlib_recv_color_format_RGBX_RGBA = 2
+NDIlib_recv_color_format_UYVY_RGBA = 3
+
+NDIlib_recv_bandwidth_highest = 100
+
 # NDI FourCC codes
 NDIlib_FourCC_type_UYVY = 0x59565955  # UYVY
 NDIlib_FourCC_type_BGRA = 0x41524742  # BGRA
@@ -90,27 +236,42 @@ NDIlib_frame_format_type_progressive = 1
 NDIlib_frame_format_type_interleaved = 0
 
 
+# Video-range (16-235 / 16-240) to JPEG full-range lookup tables
+_Y_FULL_RANGE_LUT = np.clip((np.arange(256) - 16) * 255.0 / 219.0 + 0.5, 0, 255).astype(np.uint8)
+_C_FULL_RANGE_LUT = np.clip((np.arange(256) - 128) * 255.0 / 224.0 + 128.5, 0, 255).astype(np.uint8)
+
+
+# BT.601 video-range coefficient tables for the numpy UYVY fallback: each
+# term becomes one uint8-indexed lookup instead of widened int32 math
+_levels = np.arange(256, dtype=np.int32)
+_Y_SCALED_LUT = ((298 * (_levels - 16)) >> 8).astype(np.int16)
+_R_FROM_V_LUT = ((409 * (_levels - 128) + 128) >> 8).astype(np.int16)
+_B_FROM_U_LUT = ((516 * (_levels - 128) + 128) >> 8).astype(np.int16)
+# Green mixes U and V before the shift, so its terms stay unshifted int32
+_G_FROM_U_LUT = -100 * (_levels - 128)
+_G_FROM_V_LUT = -208 * (_levels - 128) + 128
+del _levels
+
+
+# Input bytes per row band handed to one thread by the numba UYVY kernel
+UYVY_TILE_BYTES = 32 * 1024
+
+
 # UYVY to RGB conversion functions
-def _uyvy_to_rgb_numpy(active: np.ndarray, height: int, width: int) -> np.ndarray:
-    """Numpy-based UYVY to RGB conversion (fallback)"""
+def _uyvy_to_rgb_numpy(active: np.ndarray, rgb: np.ndarray, height: int, width: int) -> np.ndarray:
+    """Numpy-based UYVY to RGB conversion into rgb (fallback)"""
     pairs = active.reshape(height, width // 2, 4)
-    U = pairs[:, :, 0].astype(np.int32)
-    Y0 = pairs[:, :, 1].astype(np.int32)
-    V = pairs[:, :, 2].astype(np.int32)
-    Y1 = pairs[:, :, 3].astype(np.int32)
-
-    cb = U - 128
-    cr = V - 128
-    c0 = Y0 - 16
-    c1 = Y1 - 16
-
-    r_chroma = (409 * cr + 128) >> 8
-    g_chroma = (-100 * cb - 208 * cr + 128) >> 8
-    b_chroma = (516 * cb + 128) >> 8
-    c0_scaled = (298 * c0) >> 8
-    c1_scaled = (298 * c1) >> 8
-
-    rgb = np.empty((height, width, 3), dtype=np.uint8)
+    U = pairs[:, :, 0]
+    Y0 = pairs[:, :, 1]
+    V = pairs[:, :, 2]
+    Y1 = pairs[:, :, 3]
+
+    r_chroma = _R_FROM_V_LUT[V]
+    g_chroma = ((_G_FROM_U_LUT[U] + _G_FROM_V_LUT[V]) >> 8).astype(np.int16)
+    b_chroma = _B_FROM_U_LUT[U]
+    c0_scaled = _Y_SCALED_LUT[Y0]
+    c1_scaled = _Y_SCALED_LUT[Y1]
+
     rgb[:, 0::2, 0] = np.clip(c0_scaled + r_chroma, 0, 255)
     rgb[:, 0::2, 1] = np.clip(c0_scaled + g_chroma, 0, 255)
     rgb[:, 0::2, 2] = np.clip(c0_scaled + b_chroma, 0, 255)
@@ -121,50 +282,103 @@ def _uyvy_to_rgb_numpy(active: np.ndarray, height: int, width: int) -> np.ndarra
 
 
 if NUMBA_AVAILABLE:
+    @njit(inline='always', fastmath=True)
+    def _uyvy_row_numba(src: np.ndarray, dst: np.ndarray, half_width: int):
+        """Convert one flat UYVY row into one flat RGB row.
+        Unit-stride loads and stores, so LLVM can vectorize the pixel loop.
+        """
+        for x in range(half_width):
+            idx = x * 4
+            u = np.int32(src[idx])
+            y0 = np.int32(src[idx + 1])
+            v = np.int32(src[idx + 2])
+            y1 = np.int32(src[idx + 3])
+        
+            cb = u - 128
+            cr = v - 128
+            c0 = y0 - 16
+            c1 = y1 - 16
+        
+            r_chroma = (409 * cr + 128) >> 8
+            g_chroma = (-100 * cb - 208 * cr + 128) >> 8
+            b_chroma = (516 * cb + 128) >> 8
+            c0_scaled = (298 * c0) >> 8
+            c1_scaled = (298 * c1) >> 8
+        
+            out = x * 6
+            # Pixel 0
+            dst[out] = min(max(c0_scaled + r_chroma, 0), 255)
+            dst[out + 1] = min(max(c0_scaled + g_chroma, 0), 255)
+            dst[out + 2] = min(max(c0_scaled + b_chroma, 0), 255)
+        
+            # Pixel 1
+            dst[out + 3] = min(max(c1_scaled + r_chroma, 0), 255)
+            dst[out + 4] = min(max(c1_scaled + g_chroma, 0), 255)
+            dst[out + 5] = min(max(c1_scaled + b_chroma, 0), 255)
+
     @njit(parallel=True, cache=True, fastmath=True)
-    def _uyvy_to_rgb_numba(active: np.ndarray, height: int, width: int) -> np.ndarray:
-        """Numba JIT-compiled UYVY to RGB conversion (~10x faster)"""
-        rgb = np.empty((height, width, 3), dtype=np.uint8)
+    def _uyvy_to_rgb_numba(data: np.ndarray, rgb: np.ndarray, stride: int, height: int, width: int):
+        """Numba JIT-compiled UYVY to RGB conversion into rgb (~10x faster).
+        Reads rows of `stride` bytes straight from the flat frame buffer.
+        Disk-cached, so only the very first run on a machine compiles it.
+        """
         half_width = width // 2
+        row_bytes = width * 2
+        # Rows per thread work item: ~32 KB of UYVY input (4 rows at 4K), so
+        # each thread streams a contiguous band that stays in its L2
+        tile = max(1, UYVY_TILE_BYTES // row_bytes)
+        n_tiles = (height + tile - 1) // tile
+        for t in prange(n_tiles):
+            y_end = min((t + 1) * tile, height)
+            for y in range(t * tile, y_end):
+                row = y * stride
+                _uyvy_row_numba(data[row:row + row_bytes], rgb[y].reshape(width * 3), half_width)
+
+    @functools.lru_cache(maxsize=4)
+    def _uyvy_to_rgb_numba_specialized(height: int, width: int, stride: int):
+        """UYVY to RGB kernel specialized for one frame geometry.
+        height, width and stride are closure constants, so LLVM sees fixed
+        trip counts and row offsets and can unroll/vectorize accordingly.
+        Compiled eagerly (closures can't be disk-cached), so call this off
+        the capture path; same call signature as _uyvy_to_rgb_numba.
+        """
+        half_width = width // 2
+        row_bytes = width * 2
+        rgb_row_bytes = width * 3
+        tile = max(1, UYVY_TILE_BYTES // row_bytes)
+        n_tiles = (height + tile - 1) // tile
+        
+        @njit("void(uint8[::1], uint8[:, :, ::1], int64, int64, int64)", parallel=True, fastmath=True)
+        def kernel(data, rgb, _stride, _height, _width):
+            for t in prange(n_tiles):
+                y_end = min((t + 1) * tile, height)
+                for y in range(t * tile, y_end):
+                    row = y * stride
+                    _uyvy_row_numba(data[row:row + row_bytes], rgb[y].reshape(rgb_row_bytes), half_width)
         
+        return kernel
+
+    @njit(parallel=True, cache=True, fastmath=True)
+    def _rgbx_to_rgb_numba(data: np.ndarray, rgb: np.ndarray, stride: int, height: int, width: int,
+                           swap_rb: bool) -> np.ndarray:
+        """Numba JIT-compiled 32-bit to packed RGB copy into rgb.
+        swap_rb selects BGRA/BGRX input; otherwise RGBA/RGBX. Fixed-offset
+        byte shuffles over flat rows, which LLVM turns into vector shuffles.
+        """
+        r = 2 if swap_rb else 0
+        b = 0 if swap_rb else 2
         for y in prange(height):
-            for x in range(half_width):
-                idx = x * 4
-                u = active[y, idx]
-                y0 = active[y, idx + 1]
-                v = active[y, idx + 2]
-                y1 = active[y, idx + 3]
-                
-                cb = u - 128
-                cr = v - 128
-                c0 = y0 - 16
-                c1 = y1 - 16
-                
-                r_chroma = (409 * cr + 128) >> 8
-                g_chroma = (-100 * cb - 208 * cr + 128) >> 8
-                b_chroma = (516 * cb + 128) >> 8
-                c0_scaled = (298 * c0) >> 8
-                c1_scaled = (298 * c1) >> 8
-                
-                # Pixel 0
-                r0 = c0_scaled + r_chroma
-                g0 = c0_scaled + g_chroma
-                b0 = c0_scaled + b_chroma
-                rgb[y, x * 2, 0] = min(max(r0, 0), 255)
-                rgb[y, x * 2, 1] = min(max(g0, 0), 255)
-                rgb[y, x * 2, 2] = min(max(b0, 0), 255)
-                
-                # Pixel 1
-                r1 = c1_scaled + r_chroma
-                g1 = c1_scaled + g_chroma
-                b1 = c1_scaled + b_chroma
-                rgb[y, x * 2 + 1, 0] = min(max(r1, 0), 255)
-                rgb[y, x * 2 + 1, 1] = min(max(g1, 0), 255)
-                rgb[y, x * 2 + 1, 2] = min(max(b1, 0), 255)
+            row = y * stride
+            src = data[row:row + width * 4]
+            dst = rgb[y].reshape(width * 3)
+            for x in range(width):
+                dst[x * 3] = src[x * 4 + r]
+                dst[x * 3 + 1] = src[x * 4 + 1]
+                dst[x * 3 + 2] = src[x * 4 + b]
         
         return rgb
-else:
-    _uyvy_to_rgb_numba = _uyvy_to_rgb_numpy
+
+
 NDIlib_frame_format_type_field_0 = 2
 NDIlib_frame_format_type_field_1 = 3
 
@@ -193,6 +407,49 @@ class _NDI:
         
         # Set up function signatures
         self._setup_function_signatures()
+        
+        # Sources seen by the shared background finder, name -> (name, url)
+        # bytes; copied because the SDK's strings only live until its next
+        # refresh. Receivers look sources up here instead of waiting on a
+        # finder of their own
+        self._sources_by_name = {}
+        self._sources_changed = threading.Condition(threading.Lock())
+        threading.Thread(target=self._watch_sources, name="ndi-finder", daemon=True).start()
+    
+    def _watch_sources(self):
+        """Keep _sources_by_name current with one long-lived finder"""
+        finder = self.lib.NDIlib_find_create_v2(None)
+        if not finder:
+            print("⚠️ Failed to create background NDI finder")
+            return
+        
+        while True:
+            # Returns early when the source list changes
+            self.lib.NDIlib_find_wait_for_sources(finder, 500)
+            
+            num_sources = ctypes.c_uint32(0)
+            sources = self.lib.NDIlib_find_get_current_sources(finder, ctypes.byref(num_sources))
+            found = {}
+            for i in range(num_sources.value):
+                name = sources[i].p_ndi_name
+                if name:
+                    found[name.decode('utf-8')] = (name, sources[i].p_url_address)
+            
+            with self._sources_changed:
+                self._sources_by_name = found
+                self._sources_changed.notify_all()
+    
+    def find_source(self, source_name: str, timeout_ms: int = 2000) -> Optional[NDIlib_source_t]:
+        """Look up a source by name, waiting up to timeout_ms for it to appear"""
+        deadline = time.monotonic() + timeout_ms / 1000
+        with self._sources_changed:
+            while source_name not in self._sources_by_name:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return None
+                self._sources_changed.wait(remaining)
+            name, url = self._sources_by_name[source_name]
+        return NDIlib_source_t(p_ndi_name=name, p_url_address=url)
     
     def _setup_function_signatures(self):
         """Configure ctypes function signatures for NDI API"""
@@ -212,7 +469,7 @@ class _NDI:
         self.lib.NDIlib_find_get_current_sources.restype = ctypes.POINTER(NDIlib_source_t)
         
         # NDIlib_recv_create_v3
-        self.lib.NDIlib_recv_create_v3.argtypes = [ctypes.c_void_p]
+        self.lib.NDIlib_recv_create_v3.argtypes = [ctypes.POINTER(NDIlib_recv_create_v3_t)]
         self.lib.NDIlib_recv_create_v3.restype = ctypes.c_void_p
         
         # NDIlib_recv_connect
@@ -276,105 +533,449 @@ class NDISourceFinder:
             self.ndi.lib.NDIlib_find_destroy(self.finder)
 
 
+class _JPEGCompressor:
+    """TurboJPEG compressor handle and output buffer, reused across frames.
+    Not thread-safe; each receiver owns one and uses it under its lock.
+    """
+    
+    def __init__(self):
+        self.handle = _turbojpeg.tjInitCompress()
+        if not self.handle:
+            raise NDIError("Failed to create TurboJPEG compressor")
+        self._buf = None
+    
+    def _output(self, width: int, height: int, subsamp: int) -> ctypes.Array:
+        """Output buffer sized for the worst case, grown only when needed"""
+        size = _turbojpeg.tjBufSize(width, height, subsamp)
+        if self._buf is None or len(self._buf) < size:
+            self._buf = (ctypes.c_uint8 * size)()
+        return self._buf
+    
+    def _finish(self, status: int, buf: ctypes.Array, jpeg_size: ctypes.c_ulong) -> bytes:
+        if status != 0:
+            raise NDIError(f"TurboJPEG: {_turbojpeg.tjGetErrorStr2(self.handle).decode()}")
+        return ctypes.string_at(buf, jpeg_size.value)
+    
+    def encode(self, img: np.ndarray, quality: int, pixel_format: int, subsamp: int, flags: int = 0) -> bytes:
+        """Encode a packed pixel array (rows may be strided)"""
+        height, width = img.shape[:2]
+        buf = self._output(width, height, subsamp)
+        jpeg_buf = ctypes.c_void_p(ctypes.addressof(buf))
+        jpeg_size = ctypes.c_ulong(len(buf))
+        status = _turbojpeg.tjCompress2(
+            self.handle, img.ctypes.data, width, img.strides[0], height, pixel_format,
+            ctypes.byref(jpeg_buf), ctypes.byref(jpeg_size), subsamp, quality,
+            flags | TJFLAG_NOREALLOC
+        )
+        return self._finish(status, buf, jpeg_size)
+    
+    def encode_from_yuv(self, yuv: np.ndarray, width: int, height: int, quality: int, subsamp: int,
+                        flags: int = 0) -> bytes:
+        """Encode contiguous planar YUV (Y, U, V planes, rows unpadded)"""
+        buf = self._output(width, height, subsamp)
+        jpeg_buf = ctypes.c_void_p(ctypes.addressof(buf))
+        jpeg_size = ctypes.c_ulong(len(buf))
+        status = _turbojpeg.tjCompressFromYUV(
+            self.handle, yuv.ctypes.data, width, 1, height, subsamp,
+            ctypes.byref(jpeg_buf), ctypes.byref(jpeg_size), quality,
+            flags | TJFLAG_NOREALLOC
+        )
+        return self._finish(status, buf, jpeg_size)
+    
+    def close(self):
+        if self.handle:
+            _turbojpeg.tjDestroy(self.handle)
+            self.handle = None
+
+
 class NDIReceiver:
     """Receive video from an NDI source"""
     
-    def __init__(self, source_name: str):
+    def __init__(self, source_name: str, color_format: int = NDIlib_recv_color_format_UYVY_BGRA):
         self.ndi = _NDI.get()
         self.source_name = source_name
+        self.color_format = color_format
         self._closed = False
         self._lock = threading.Lock()
+        # Captures in flight; close() waits for them before destroying the
+        # receiver, since captures block without holding the lock
+        self._active_captures = 0
+        self._captures_idle = threading.Condition(self._lock)
+        # Frames skipped to stay on the newest one, reported once per second
+        self.dropped_frames = 0
+        self._drops_pending = 0
+        self._drops_log_ts = time.monotonic()
+        # libswscale context, reused while the frame size stays the same
+        self._sws_ctx = None
+        # RGB conversion output, reused while the frame size stays the same
+        self._rgb_buf = None
+        # uint8 views of SDK frame buffers by (address, size); the SDK cycles
+        # through a small pool of buffers, so views are reused across frames
+        self._frame_views = {}
+        # RGB converter bound to the current (FourCC, width, height, stride)
+        self._converter = None
+        self._fmt_key = None
+        # libjpeg-turbo compressor, created on the first JPEG request
+        self._jpeg = None
+        # Planar YUV staging buffer for UYVY JPEG encoding, reused per size
+        self._yuv_buf = None
         
-        # Find the source
-        finder = self.ndi.lib.NDIlib_find_create_v2(None)
-        if not finder:
-            raise NDIError("Failed to create finder for receiver")
+        # Find the source; usually already known to the background finder
+        target_source = self.ndi.find_source(source_name, 2000)
+        if not target_source:
+            raise NDIError(f"Source '{source_name}' not found")
         
-        try:
-            # Wait for sources
-            self.ndi.lib.NDIlib_find_wait_for_sources(finder, 2000)
-            
-            # Get sources
-            num_sources = ctypes.c_uint32(0)
-            sources = self.ndi.lib.NDIlib_find_get_current_sources(
-                finder,
-                ctypes.byref(num_sources)
+        # Create receiver
+        settings = NDIlib_recv_create_v3_t(
+            color_format=color_format,
+            bandwidth=NDIlib_recv_bandwidth_highest,
+            allow_video_fields=True,
+        )
+        self.receiver = self.ndi.lib.NDIlib_recv_create_v3(ctypes.byref(settings))
+        if not self.receiver:
+            raise NDIError("Failed to create NDI receiver")
+        
+        # Connect to source
+        self.ndi.lib.NDIlib_recv_connect(self.receiver, ctypes.byref(target_source))
+        
+        print(f"✅ Connected to NDI source: {source_name}")
+    
+    def _rgb_output(self, height: int, width: int) -> np.ndarray:
+        """Reusable RGB output buffer, reallocated only when the size changes"""
+        if self._rgb_buf is None or self._rgb_buf.shape != (height, width, 3):
+            self._rgb_buf = np.empty((height, width, 3), dtype=np.uint8)
+        return self._rgb_buf
+    
+    def _frame_data(self, video_frame: NDIlib_video_frame_v2_t, size: int) -> np.ndarray:
+        """Zero-copy uint8 view of the first `size` bytes of an SDK frame buffer"""
+        key = (ctypes.addressof(video_frame.p_data.contents), size)
+        view = self._frame_views.get(key)
+        if view is None:
+            if len(self._frame_views) >= 16:
+                # Buffer pool changed (e.g. new resolution); drop stale views
+                self._frame_views.clear()
+            view = np.ctypeslib.as_array(video_frame.p_data, shape=(size,))
+            self._frame_views[key] = view
+        return view
+    
+    def _rgbx_frame_to_rgb(
+        self,
+        video_frame: NDIlib_video_frame_v2_t,
+        rgb: np.ndarray,
+        stride: int,
+        swap_rb: bool
+    ) -> np.ndarray:
+        """32-bit (BGRA/BGRX/RGBA/RGBX) frame to RGB"""
+        height, width = rgb.shape[:2]
+        data = self._frame_data(video_frame, stride * height)
+        if NUMBA_AVAILABLE:
+            _rgbx_to_rgb_numba(data, rgb, stride, height, width, swap_rb)
+            return rgb
+        
+        array = data.reshape((height, stride))[:, :width * 4].reshape((height, width, 4))
+        if swap_rb:
+            # Convert BGRA to RGB: reversed channel view, one strided copy
+            np.copyto(rgb, array[:, :, 2::-1])
+        else:
+            # Take just RGB
+            np.copyto(rgb, array[:, :, :3])
+        return rgb
+    
+    def _uyvy_frame_to_rgb(
+        self,
+        video_frame: NDIlib_video_frame_v2_t,
+        rgb: np.ndarray,
+        stride: int,
+        kernel=None
+    ) -> np.ndarray:
+        """UYVY frame to RGB with numba JIT if available (~10x faster than numpy)"""
+        height, width = rgb.shape[:2]
+        uyvy = self._frame_data(video_frame, stride * height)
+        
+        if kernel is not None:
+            # Kernel indexes rows by stride itself; no contiguous copy
+            kernel(uyvy, rgb, stride, height, width)
+        else:
+            # Strided view of the active pixels (padding beyond width*2 skipped)
+            active = uyvy.reshape((height, stride))[:, :width * 2]
+            _uyvy_to_rgb_numpy(active, rgb, height, width)
+        
+        return rgb
+    
+    def _make_rgb_converter(
+        self,
+        fourcc: int,
+        width: int,
+        height: int,
+        stride: int,
+        out_width: int,
+        out_height: int
+    ):
+        """Pick and bind the RGB converter for one frame format and output size"""
+        resize = (out_width, out_height) != (width, height)
+        
+        if fourcc == NDIlib_FourCC_type_UYVY and SWSCALE_AVAILABLE:
+            # libswscale's SIMD kernels straight from the SDK buffer, with
+            # any resize folded into the same pass
+            if not resize:
+                flags = SWS_POINT
+            elif out_width * out_height < width * height:
+                flags = SWS_AREA
+            else:
+                flags = SWS_LANCZOS
+            self._sws_ctx = _swscale.sws_getCachedContext(
+                self._sws_ctx,
+                width, height, AV_PIX_FMT_UYVY422,
+                out_width, out_height, AV_PIX_FMT_RGB24,
+                flags, None, None, None
             )
+            if self._sws_ctx:
+                rgb = self._rgb_output(out_height, out_width)
+                return functools.partial(
+                    self._uyvy_frame_to_rgb_swscale,
+                    rgb=rgb,
+                    src_stride=(ctypes.c_int * 4)(stride if stride else width * 2),
+                    dst=(ctypes.POINTER(ctypes.c_uint8) * 4)(rgb.ctypes.data_as(ctypes.POINTER(ctypes.c_uint8))),
+                    dst_stride=(ctypes.c_int * 4)(out_width * 3)
+                )
+        
+        rgb = self._rgb_output(height, width)
+        if fourcc in (NDIlib_FourCC_type_BGRA, NDIlib_FourCC_type_BGRX,
+                      NDIlib_FourCC_type_RGBA, NDIlib_FourCC_type_RGBX):
+            converter = functools.partial(
+                self._rgbx_frame_to_rgb,
+                rgb=rgb,
+                stride=stride if stride else width * 4,
+                swap_rb=fourcc in (NDIlib_FourCC_type_BGRA, NDIlib_FourCC_type_BGRX)
+            )
+        
+        elif fourcc == NDIlib_FourCC_type_UYVY:
+            converter = functools.partial(
+                self._uyvy_frame_to_rgb,
+                rgb=rgb,
+                stride=stride if stride else width * 2,
+                kernel=_uyvy_to_rgb_numba if NUMBA_AVAILABLE else None
+            )
+            if NUMBA_AVAILABLE:
+                # The cached generic kernel runs until the specialized one is built
+                threading.Thread(
+                    target=self._specialize_uyvy,
+                    args=((fourcc, width, height, stride, out_width, out_height), rgb),
+                    daemon=True
+                ).start()
+        
+        else:
+            raise NDIError(f"Unsupported FourCC format: 0x{fourcc:08X}")
+        
+        if resize:
+            return functools.partial(self._resized_rgb, converter=converter, size=(out_width, out_height))
+        return converter
+    
+    def _specialize_uyvy(self, key: tuple, rgb: np.ndarray):
+        """Compile the geometry-specialized UYVY kernel outside the receiver
+        lock, then swap it in if the frame format hasn't changed meanwhile.
+        """
+        _, width, height, stride, out_width, out_height = key
+        stride = stride if stride else width * 2
+        try:
+            kernel = _uyvy_to_rgb_numba_specialized(height, width, stride)
+        except Exception as e:
+            print(f"⚠️ Specialized UYVY kernel unavailable: {e}")
+            return
+        
+        converter = functools.partial(self._uyvy_frame_to_rgb, rgb=rgb, stride=stride, kernel=kernel)
+        if (out_width, out_height) != (width, height):
+            converter = functools.partial(self._resized_rgb, converter=converter, size=(out_width, out_height))
+        with self._lock:
+            if self._fmt_key == key:
+                self._converter = converter
+    
+    def _resized_rgb(self, video_frame: NDIlib_video_frame_v2_t, converter, size: tuple) -> np.ndarray:
+        """Convert at native size, then resize with PIL (no libswscale path)"""
+        img = Image.fromarray(converter(video_frame), 'RGB')
+        return np.asarray(img.resize(size, Image.Resampling.LANCZOS))
+    
+    def _convert_frame_to_rgb(
+        self,
+        video_frame: NDIlib_video_frame_v2_t,
+        output_width: int = 0,
+        output_height: int = 0
+    ) -> np.ndarray:
+        """Convert NDI video frame to RGB numpy array, optionally resized.
+        The result may be a buffer owned by the receiver that is overwritten
+        by the next conversion; copy it to keep it.
+        """
+        width = video_frame.xres
+        height = video_frame.yres
+        if not (output_width > 0 and output_height > 0):
+            output_width, output_height = width, height
+        
+        # The converter is bound once per format/geometry, not per frame
+        key = (video_frame.FourCC, width, height, video_frame.line_stride_in_bytes, output_width, output_height)
+        if key != self._fmt_key:
+            self._converter = self._make_rgb_converter(*key)
+            self._fmt_key = key
+        return self._converter(video_frame)
+    
+    def _uyvy_frame_to_rgb_swscale(
+        self,
+        video_frame: NDIlib_video_frame_v2_t,
+        rgb: np.ndarray,
+        src_stride: ctypes.Array,
+        dst: ctypes.Array,
+        dst_stride: ctypes.Array
+    ) -> np.ndarray:
+        """UYVY to RGB conversion (and resize) with libswscale, reading the SDK buffer in place"""
+        src = (ctypes.POINTER(ctypes.c_uint8) * 4)(video_frame.p_data)
+        _swscale.sws_scale(self._sws_ctx, src, src_stride, 0, video_frame.yres, dst, dst_stride)
+        return rgb
+    
+    def _begin_capture(self) -> bool:
+        """Register an in-flight capture; False if the receiver is closed"""
+        with self._lock:
+            if self._closed:
+                return False
+            self._active_captures += 1
+            return True
+    
+    def _end_capture(self):
+        with self._lock:
+            self._active_captures -= 1
+            if self._active_captures == 0:
+                self._captures_idle.notify_all()
+    
+    def _capture_latest_video(self, timeout_ms: int) -> Optional[NDIlib_video_frame_v2_t]:
+        """Capture a video frame, then drain any newer ones already queued by
+        the SDK so the caller always gets the freshest (lowest latency) frame.
+        Returns None if no video frame arrived. Caller must have registered
+        with _begin_capture() and must free the returned frame.
+        """
+        video_frame = NDIlib_video_frame_v2_t()
+        
+        # Capture frame (type 1 = video)
+        frame_type = self.ndi.lib.NDIlib_recv_capture_v2(
+            self.receiver,
+            ctypes.byref(video_frame),
+            None,  # audio
+            None,  # metadata
+            timeout_ms
+        )
+        
+        if frame_type != 1:  # 1 = video frame
+            return None
+        
+        while True:
+            newer = NDIlib_video_frame_v2_t()
+            if self.ndi.lib.NDIlib_recv_capture_v2(self.receiver, ctypes.byref(newer), None, None, 0) != 1:
+                break
+            self.ndi.lib.NDIlib_recv_free_video_v2(self.receiver, ctypes.byref(video_frame))
+            video_frame = newer
+            self.dropped_frames += 1
+            self._drops_pending += 1
+        
+        if self._drops_pending:
+            now = time.monotonic()
+            if now - self._drops_log_ts >= 1.0:
+                print(f"⏭️  Dropped {self._drops_pending} stale frame(s) from {self.source_name}")
+                self._drops_pending = 0
+                self._drops_log_ts = now
+        
+        return video_frame
+    
+    @contextmanager
+    def _captured_video(self, timeout_ms: int):
+        """Capture the latest video frame and yield it with the receiver lock
+        held (conversion uses the receiver's shared buffers), or yield None
+        if the receiver is closed or no frame arrived. Frees the frame and
+        ends the capture on exit.
+        """
+        if not self._begin_capture():
+            yield None
+            return
+        try:
+            # Wait for a frame without holding the lock, so other callers
+            # and close() are not serialized behind the blocking capture
+            video_frame = self._capture_latest_video(timeout_ms)
+            if video_frame is None:
+                yield None
+                return
             
-            # Find matching source
-            target_source = None
-            for i in range(num_sources.value):
-                name = sources[i].p_ndi_name.decode('utf-8') if sources[i].p_ndi_name else ""
-                if name == source_name:
-                    target_source = sources[i]
-                    break
-            
-            if not target_source:
-                raise NDIError(f"Source '{source_name}' not found")
-            
-            # Create receiver
-            self.receiver = self.ndi.lib.NDIlib_recv_create_v3(None)
-            if not self.receiver:
-                raise NDIError("Failed to create NDI receiver")
-            
-            # Connect to source
-            self.ndi.lib.NDIlib_recv_connect(self.receiver, ctypes.byref(target_source))
-            
-            print(f"✅ Connected to NDI source: {source_name}")
-            
+            try:
+                with self._lock:
+                    yield video_frame
+            finally:
+                # Free the video frame
+                self.ndi.lib.NDIlib_recv_free_video_v2(
+                    self.receiver,
+                    ctypes.byref(video_frame)
+                )
         finally:
-            self.ndi.lib.NDIlib_find_destroy(finder)
+            self._end_capture()
     
-    def _convert_frame_to_rgb(self, video_frame: NDIlib_video_frame_v2_t) -> np.ndarray:
-        """Convert NDI video frame to RGB numpy array"""
+    def _convert_frame_to_bgra(
+        self,
+        video_frame: NDIlib_video_frame_v2_t,
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """Copy an NDI video frame out as a packed BGRA numpy array.
+        Writes into `out` when it has the frame's shape, else allocates.
+        """
         width = video_frame.xres
         height = video_frame.yres
         fourcc = video_frame.FourCC
+        if out is None or out.shape != (height, width, 4):
+            out = np.empty((height, width, 4), dtype=np.uint8)
         
         if fourcc == NDIlib_FourCC_type_BGRA or fourcc == NDIlib_FourCC_type_BGRX:
-            # BGRA/BGRX format
-            frame_data = ctypes.cast(
-                video_frame.p_data,
-                ctypes.POINTER(ctypes.c_uint8 * (width * height * 4))
-            ).contents
-            array = np.frombuffer(frame_data, dtype=np.uint8).reshape((height, width, 4))
-            # Convert BGRA to RGB
-            return array[:, :, [2, 1, 0]]
-        
-        elif fourcc == NDIlib_FourCC_type_RGBA or fourcc == NDIlib_FourCC_type_RGBX:
-            # RGBA/RGBX format
-            frame_data = ctypes.cast(
-                video_frame.p_data,
-                ctypes.POINTER(ctypes.c_uint8 * (width * height * 4))
-            ).contents
-            array = np.frombuffer(frame_data, dtype=np.uint8).reshape((height, width, 4))
-            # Take just RGB
-            return array[:, :, :3]
+            # Already in the display's byte order; one copy out of the
+            # SDK's buffer (freed after capture), dropping any row padding
+            stride = video_frame.line_stride_in_bytes if video_frame.line_stride_in_bytes else width * 4
+            rows = self._frame_data(video_frame, stride * height).reshape((height, stride))
+            np.copyto(out, rows[:, :width * 4].reshape((height, width, 4)))
+            return out
         
-        elif fourcc == NDIlib_FourCC_type_UYVY:
-            # UYVY format - use numba JIT if available for ~10x speedup
-            stride = video_frame.line_stride_in_bytes if video_frame.line_stride_in_bytes else width * 2
-            frame_size = stride * height
-
-            frame_data = ctypes.cast(
-                video_frame.p_data,
-                ctypes.POINTER(ctypes.c_uint8 * frame_size)
-            ).contents
-
-            uyvy = np.frombuffer(frame_data, dtype=np.uint8)[:frame_size].reshape((height, stride))
-            # Use only the active pixels (ignore padding beyond width*2)
-            # Make contiguous for numba performance
-            active = np.ascontiguousarray(uyvy[:, :width * 2])
-            
-            if NUMBA_AVAILABLE:
-                rgb = _uyvy_to_rgb_numba(active, height, width)
-            else:
-                rgb = _uyvy_to_rgb_numpy(active, height, width)
-            
-            return rgb
+        # Other formats go through RGB
+        rgb = self._convert_frame_to_rgb(video_frame)
+        out[:, :, 0] = rgb[:, :, 2]
+        out[:, :, 1] = rgb[:, :, 1]
+        out[:, :, 2] = rgb[:, :, 0]
+        out[:, :, 3] = 255
+        return out
+    
+    def _jpeg_compressor(self) -> _JPEGCompressor:
+        if self._jpeg is None:
+            self._jpeg = _JPEGCompressor()
+        return self._jpeg
+    
+    def _uyvy_to_jpeg_turbo(self, video_frame: NDIlib_video_frame_v2_t, jpeg_quality: int) -> bytes:
+        """Encode a UYVY frame as 4:2:2 JPEG with libjpeg-turbo, skipping RGB.
+        The packed samples are split into Y/U/V planes (range-expanded through
+        a lookup table on the way) and handed to the encoder as planar YUV.
+        """
+        width = video_frame.xres
+        height = video_frame.yres
+        stride = video_frame.line_stride_in_bytes if video_frame.line_stride_in_bytes else width * 2
+        rows = self._frame_data(video_frame, stride * height).reshape((height, stride))[:, :width * 2]
         
-        else:
-            raise NDIError(f"Unsupported FourCC format: 0x{fourcc:08X}")
+        y_size = width * height
+        c_size = y_size // 2
+        if self._yuv_buf is None or self._yuv_buf.size != y_size + 2 * c_size:
+            self._yuv_buf = np.empty(y_size + 2 * c_size, dtype=np.uint8)
+        yuv = self._yuv_buf
+        # uint8 indices can't leave the 256-entry tables; mode='clip' lets
+        # take() write straight into out instead of through a temporary
+        np.take(_Y_FULL_RANGE_LUT, rows[:, 1::2], out=yuv[:y_size].reshape((height, width)), mode='clip')
+        np.take(_C_FULL_RANGE_LUT, rows[:, 0::4], out=yuv[y_size:y_size + c_size].reshape((height, width // 2)),
+                mode='clip')
+        np.take(_C_FULL_RANGE_LUT, rows[:, 2::4], out=yuv[y_size + c_size:].reshape((height, width // 2)),
+                mode='clip')
+        
+        return self._jpeg_compressor().encode_from_yuv(
+            yuv, width, height,
+            quality=jpeg_quality,
+            subsamp=TJSAMP_422,
+            flags=TJFLAG_FASTDCT
+        )
     
     def get_jpeg_frame(
         self,
@@ -384,46 +985,33 @@ class NDIReceiver:
         output_height: int = 0
     ) -> Optional[bytes]:
         """Capture a frame and return as JPEG bytes"""
-        with self._lock:
-            if self._closed:
+        with self._captured_video(timeout_ms) as video_frame:
+            if video_frame is None:
                 return None
             
-            video_frame = NDIlib_video_frame_v2_t()
+            # UYVY at native size: color conversion happens in the encoder
+            if (TURBOJPEG_AVAILABLE and video_frame.FourCC == NDIlib_FourCC_type_UYVY
+                    and not (output_width > 0 and output_height > 0)):
+                return self._uyvy_to_jpeg_turbo(video_frame, jpeg_quality)
             
-            # Capture frame (type 1 = video)
-            frame_type = self.ndi.lib.NDIlib_recv_capture_v2(
-                self.receiver,
-                ctypes.byref(video_frame),
-                None,  # audio
-                None,  # metadata
-                timeout_ms
-            )
-            
-            if frame_type != 1:  # 1 = video frame
-                return None
+            # Convert to RGB, resizing in the same pass if requested
+            rgb_array = self._convert_frame_to_rgb(video_frame, output_width, output_height)
             
-            try:
-                # Convert to RGB
-                rgb_array = self._convert_frame_to_rgb(video_frame)
-                
-                # Convert to PIL Image
-                img = Image.fromarray(rgb_array, 'RGB')
-                
-                # Resize if requested
-                if output_width > 0 and output_height > 0:
-                    img = img.resize((output_width, output_height), Image.Resampling.LANCZOS)
-                
-                # Convert to JPEG
-                buffer = BytesIO()
-                img.save(buffer, format='JPEG', quality=jpeg_quality, optimize=True)
-                return buffer.getvalue()
-                
-            finally:
-                # Free the video frame
-                self.ndi.lib.NDIlib_recv_free_video_v2(
-                    self.receiver,
-                    ctypes.byref(video_frame)
+            if TURBOJPEG_AVAILABLE:
+                # SIMD encoder, several times faster than PIL
+                return self._jpeg_compressor().encode(
+                    rgb_array,
+                    quality=jpeg_quality,
+                    pixel_format=TJPF_RGB,
+                    subsamp=TJSAMP_422,
+                    flags=TJFLAG_FASTDCT
                 )
+            
+            # Convert to JPEG
+            img = Image.fromarray(rgb_array, 'RGB')
+            buffer = BytesIO()
+            img.save(buffer, format='JPEG', quality=jpeg_quality)
+            return buffer.getvalue()
 
     def get_rgb_frame(
         self,
@@ -432,54 +1020,49 @@ class NDIReceiver:
         output_height: int = 0
     ) -> Optional[tuple]:
         """Capture a frame and return as (RGB ndarray, (width, height)).
-        This avoids JPEG encoding for higher throughput.
+        This avoids JPEG encoding for higher throughput. The array is usually
+        the receiver's reused buffer, valid until the next capture.
         """
-        with self._lock:
-            if self._closed:
+        with self._captured_video(timeout_ms) as video_frame:
+            if video_frame is None:
                 return None
-
-            video_frame = NDIlib_video_frame_v2_t()
-
-            # Capture frame (type 1 = video)
-            frame_type = self.ndi.lib.NDIlib_recv_capture_v2(
-                self.receiver,
-                ctypes.byref(video_frame),
-                None,  # audio
-                None,  # metadata
-                timeout_ms
-            )
-
-            if frame_type != 1:  # 1 = video frame
+            
+            # Convert to RGB ndarray, resizing in the same pass if requested
+            rgb_array = self._convert_frame_to_rgb(video_frame, output_width, output_height)
+            h, w = rgb_array.shape[:2]
+            return (rgb_array, (w, h))
+    
+    def get_bgra_frame(self, timeout_ms: int = 30, out: Optional[np.ndarray] = None) -> Optional[tuple]:
+        """Capture a frame and return as (BGRA ndarray, (width, height)).
+        With a receiver created with NDIlib_recv_color_format_BGRX_BGRA the
+        SDK already decodes to this layout, so no per-pixel conversion is done.
+        Pass a preallocated `out` array to reuse it; the returned array is
+        `out` unless the frame size changed.
+        """
+        with self._captured_video(timeout_ms) as video_frame:
+            if video_frame is None:
                 return None
-
-            try:
-                # Convert to RGB ndarray
-                rgb_array = self._convert_frame_to_rgb(video_frame)
-
-                # Optionally resize if requested
-                if output_width > 0 and output_height > 0:
-                    img = Image.fromarray(rgb_array, 'RGB')
-                    img = img.resize((output_width, output_height), Image.Resampling.LANCZOS)
-                    rgb_array = np.asarray(img)
-
-                h, w = rgb_array.shape[:2]
-                return (rgb_array, (w, h))
-
-            finally:
-                # Free the video frame
-                self.ndi.lib.NDIlib_recv_free_video_v2(
-                    self.receiver,
-                    ctypes.byref(video_frame)
-                )
+            
+            bgra_array = self._convert_frame_to_bgra(video_frame, out)
+            return (bgra_array, (video_frame.xres, video_frame.yres))
     
     def close(self):
         """Close the receiver"""
         with self._lock:
             if not self._closed:
                 self._closed = True
+                # In-flight captures end within their timeout
+                while self._active_captures:
+                    self._captures_idle.wait()
                 if hasattr(self, 'receiver') and self.receiver:
                     self.ndi.lib.NDIlib_recv_destroy(self.receiver)
                     print(f"🔌 Disconnected from: {self.source_name}")
+                if getattr(self, '_sws_ctx', None):
+                    _swscale.sws_freeContext(self._sws_ctx)
+                    self._sws_ctx = None
+                if getattr(self, '_jpeg', None):
+                    self._jpeg.close()
+                    self._jpeg = None
     
     def __del__(self):
         self.close()
@@ -53,6 +53,11 @@ class NDISourceFinder:
 class NDIReceiver:
     """Mock NDI receiver that generates test video frames"""
     
+    # (large, small) overlay fonts, loaded once for all receivers
+    _fonts = None
+    # Pre-rasterized bouncing circle, shared by all receivers
+    _circle = None
+    
     def __init__(self, source_name: str):
         self.source_name = source_name
         self._closed = False
@@ -74,45 +79,91 @@ class NDIReceiver:
             raise NDIError(f"Source '{source_name}' not found")
         
         self._lock = threading.Lock()
+        # Static gradient components per (width, height)
+        self._gradients = {}
+        # Pre-rendered RGBA layer with the text that never changes, per size
+        self._static_overlays = {}
+    
+    @classmethod
+    def _get_fonts(cls) -> tuple:
+        """Load the overlay fonts on first use"""
+        if cls._fonts is None:
+            # Try to use a default font, fall back to default if unavailable
+            try:
+                font_large = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 60)
+                font_small = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 30)
+            except Exception:
+                font_large = ImageFont.load_default()
+                font_small = ImageFont.load_default()
+            cls._fonts = (font_large, font_small)
+        return cls._fonts
+    
+    @classmethod
+    def _get_circle(cls) -> Image.Image:
+        """Rasterize the bouncing circle once into an RGBA stamp"""
+        if cls._circle is None:
+            # Opaque fill, as drawn directly onto the RGB frame before
+            circle = Image.new('RGBA', (61, 61), (0, 0, 0, 0))
+            ImageDraw.Draw(circle).ellipse([0, 0, 60, 60], fill=(255, 0, 0, 255), outline=(255, 255, 255, 255))
+            cls._circle = circle
+        return cls._circle
+    
+    def _static_overlay(self, size: tuple) -> Image.Image:
+        """Source name and watermark, drawn once onto a transparent layer"""
+        if size not in self._static_overlays:
+            font_large, font_small = self._get_fonts()
+            overlay = Image.new('RGBA', size, (0, 0, 0, 0))
+            draw = ImageDraw.Draw(overlay)
+            
+            # Draw source name
+            draw.text((40, 40), self.source_name, fill=(255, 255, 255, 255), font=font_large)
+            
+            # Draw "SIMULATED" watermark
+            watermark_x = size[0] // 2
+            watermark_y = size[1] - 80
+            draw.text((watermark_x, watermark_y), "🎬 SIMULATED NDI SOURCE", 
+                      fill=(255, 255, 0, 255), font=font_small, anchor="mm")
+            
+            self._static_overlays[size] = overlay
+        return self._static_overlays[size]
+    
+    def _gradient(self, width: int, height: int) -> tuple:
+        """Per-column red, per-row green and full-frame blue gradient bases"""
+        key = (width, height)
+        if key not in self._gradients:
+            xs = np.arange(width, dtype=np.int32)
+            ys = np.arange(height, dtype=np.int32)
+            r = xs * 255 // width
+            g = ys * 255 // height
+            b = ((xs[None, :] + ys[:, None]) * 255 // (width + height)).astype(np.uint8)
+            self._gradients[key] = (r, g, b)
+        return self._gradients[key]
     
     def _generate_test_frame(self, width: int, height: int) -> np.ndarray:
         """Generate a test pattern frame with animated elements"""
-        # Create a gradient background
-        frame = np.zeros((height, width, 3), dtype=np.uint8)
+        frame = np.empty((height, width, 3), dtype=np.uint8)
         
         # Animated color shift
         elapsed = time.time() - self._start_time
         hue_shift = int((elapsed * 20) % 360)
         
-        # Create gradient
-        for y in range(height):
-            for x in range(width):
-                r = int((x / width) * 255)
-                g = int((y / height) * 255)
-                b = int(((x + y) / (width + height)) * 255)
-                
-                # Apply hue shift
-                r = (r + hue_shift) % 256
-                g = (g + hue_shift // 2) % 256
-                
-                frame[y, x] = [r, g, b]
+        # Gradient background: only the shifted red/green vectors change per
+        # frame; broadcasting fills the rows/columns
+        r, g, b = self._gradient(width, height)
+        frame[:, :, 0] = ((r + hue_shift) % 256)[None, :]
+        frame[:, :, 1] = ((g + hue_shift // 2) % 256)[:, None]
+        frame[:, :, 2] = b
         
         return frame
     
     def _add_overlays(self, img: Image.Image) -> Image.Image:
         """Add text overlays and animated elements to the frame"""
-        draw = ImageDraw.Draw(img)
+        # Source name and watermark never change
+        overlay = self._static_overlay(img.size)
+        img.paste(overlay, mask=overlay)
         
-        # Try to use a default font, fall back to default if unavailable
-        try:
-            font_large = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 60)
-            font_small = ImageFont.truetype("/System/Library/Fonts/Helvetica.ttc", 30)
-        except:
-            font_large = ImageFont.load_default()
-            font_small = ImageFont.load_default()
-        
-        # Draw source name
-        draw.text((40, 40), self.source_name, fill=(255, 255, 255, 200), font=font_large)
+        draw = ImageDraw.Draw(img)
+        _, font_small = self._get_fonts()
         
         # Draw frame counter
         elapsed = time.time() - self._start_time
@@ -127,14 +178,8 @@ class NDIReceiver:
         # Draw animated bouncing circle
         circle_x = int(abs(np.sin(elapsed * 2)) * (img.width - 100) + 50)
         circle_y = int(abs(np.cos(elapsed * 2)) * (img.height - 100) + 50)
-        draw.ellipse([circle_x - 30, circle_y - 30, circle_x + 30, circle_y + 30], 
-                     fill=(255, 0, 0, 128), outline=(255, 255, 255))
-        
-        # Draw "SIMULATED" watermark
-        watermark_x = img.width // 2
-        watermark_y = img.height - 80
-        draw.text((watermark_x, watermark_y), "🎬 SIMULATED NDI SOURCE", 
-                  fill=(255, 255, 0, 150), font=font_small, anchor="mm")
+        circle = self._get_circle()
+        img.paste(circle, (circle_x - 30, circle_y - 30), mask=circle)
         
         return img
     
@@ -185,7 +230,7 @@ class NDIReceiver:
             
             # Convert to JPEG
             buffer = BytesIO()
-            img.save(buffer, format='JPEG', quality=jpeg_quality, optimize=True)
+            img.save(buffer, format='JPEG', quality=jpeg_quality)
             jpeg_bytes = buffer.getvalue()
             
             self._frame_count += 1